@@ -0,0 +1,361 @@
+"""
+Local HTTP/JSON API for the computed dashboard state.
+
+Serves the raw series, correlation tables and chart payloads from the snapshot the
+dashboard persists, so other tools can read the numbers without scraping the UI.
+Responses carry an ETag tied to the snapshot version: a client sending it back in
+If-None-Match gets a 304 without anything being rebuilt. Bodies are gzip-compressed
+when the client accepts it, and tabular resources are also available as Arrow IPC
+streams (Accept: application/vnd.apache.arrow.stream, or ?format=arrow).
+
+Run from the project root:
+
+    python src/api_server.py --port 8502
+
+Endpoints:
+    GET /api/v1/meta
+    GET /api/v1/series/<symbol>
+    GET /api/v1/correlations[?windows=15,30,60&statistic=beta]
+    GET /api/v1/charts/correlation[?windows=15,30,60&statistic=beta]
+    GET /api/v1/charts/price[?mode=envelope&highlight=SYMBOL,SYMBOL]
+
+Statistics: correlation (default, of price levels), and beta, covariance,
+asset_volatility, btc_volatility and volatility_ratio (of per-bar log returns).
+"""
+import os
+import sys
+import json
+import gzip
+import logging
+import hashlib
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from data_processing.correlation import STATISTICS, get_price_series, window_statistics
+from storage.snapshot import SNAPSHOT_PATH, Snapshot, load_snapshot
+from views.charts import create_correlation_chart, create_envelope_chart, create_multi_asset_chart, parse_windows
+
+# Optional: only needed for Arrow responses
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+API_HOST = os.environ.get("MACRO_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("MACRO_API_PORT", "8502"))
+
+JSON_TYPE = "application/json"
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+
+# Smaller bodies are sent uncompressed; gzip overhead outweighs the savings
+GZIP_MIN_BYTES = 1024
+
+# Rendered responses kept per snapshot version; query strings are client-controlled
+RESPONSE_CACHE_SIZE = 256
+
+logger = logging.getLogger("api_server")
+
+class ApiError(Exception):
+    """Error mapped to an HTTP status and a JSON error body."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class ComputedState:
+    """
+    Snapshot-backed state with a response cache per snapshot version.
+
+    The snapshot is reloaded only when the file changes on disk; until then the
+    most recently used rendered responses are kept, so repeated requests never
+    recompute.
+
+    :param path: Snapshot file written by the dashboard or the worker.
+    :param max_responses: Number of rendered responses to keep.
+    """
+    def __init__(self, path: str, max_responses: int = RESPONSE_CACHE_SIZE):
+        self.path = path
+        self.max_responses = max_responses
+        self._snapshot: Optional[Snapshot] = None
+        self._stamp = None
+        self._version: Optional[str] = None
+        self._responses: "OrderedDict[Tuple, Tuple[bytes, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def current(self) -> Tuple[Snapshot, str]:
+        """
+        Returns the current snapshot and its version tag, reloading it if the file changed.
+
+        :raises ApiError: 503 if no snapshot has been written yet.
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+                stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            except OSError:
+                stamp = None
+            if stamp != self._stamp:
+                snapshot = load_snapshot(self.path) if stamp is not None else None
+                self._snapshot = snapshot
+                self._stamp = stamp
+                self._responses = OrderedDict()
+                self._version = None if snapshot is None else hashlib.sha1(
+                    f"{snapshot.info.created_at.isoformat()}|{snapshot.info.config_hash}".encode("utf-8")
+                ).hexdigest()
+            if self._snapshot is None:
+                raise ApiError(503, "No computed state available yet")
+            return self._snapshot, self._version
+
+    def response(self, key: Tuple, build: Callable[[], Tuple[bytes, str]]) -> Tuple[bytes, str]:
+        """
+        Returns a cached (body, content type) for the current version, building it once.
+
+        :param key: Cache key, including the snapshot version.
+        :param build: Callable producing the (body, content type) tuple.
+        """
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+        if cached is None:
+            cached = build()
+            with self._lock:
+                self._responses[key] = cached
+                while len(self._responses) > self.max_responses:
+                    self._responses.popitem(last=False)
+        return cached
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Tells whether an Accept-Encoding header allows a gzip-encoded response.
+
+    Codings are weighed by their q-values: "gzip;q=0" refuses gzip, and a "*" entry
+    applies when gzip is not listed by name. Malformed q-values count as 0.
+
+    :param accept_encoding: Value of the Accept-Encoding request header.
+    :return: True if gzip has a non-zero q-value.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.lower()] = weight
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
+
+def _json_body(payload: Any) -> Tuple[bytes, str]:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8"), JSON_TYPE
+
+def _frame_json(frame) -> Any:
+    """Frame as {"columns", "index", "data"} with ISO dates and nulls for missing values."""
+    return json.loads(frame.to_json(orient="split", date_format="iso"))
+
+def _arrow_body(frame) -> Tuple[bytes, str]:
+    if pa is None:
+        raise ApiError(406, "Arrow responses require pyarrow")
+    frame = frame.copy()
+    frame.attrs = {}
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes(), ARROW_TYPE
+
+def _windows(query: Dict[str, List[str]]) -> Optional[List[int]]:
+    if "windows" not in query:
+        return None
+    try:
+        return parse_windows(query["windows"][0])
+    except ValueError as e:
+        raise ApiError(400, f"Invalid windows: {e}")
+
+def _statistic(query: Dict[str, List[str]]) -> str:
+    statistic = query.get("statistic", ["correlation"])[0]
+    if statistic not in STATISTICS:
+        raise ApiError(400, f"Unknown statistic {statistic}; expected one of {', '.join(STATISTICS)}")
+    return statistic
+
+def _correlations(market_data: Dict[str, Any], windows: Optional[List[int]], statistic: str = "correlation"):
+    if windows is None and statistic == "correlation":
+        return market_data["correlation_data"]
+    tables = window_statistics(market_data["moment_index"], windows or market_data["timeframes"])
+    return {symbol: table[statistic] for symbol, table in tables.items()}
+
+def _price_frame(market_data: Dict[str, Any], symbol: str):
+    if symbol in market_data["raw_data"]:
+        return market_data["raw_data"][symbol]
+    if symbol == "INDEX:BTCUSD":
+        return market_data["bitcoin_data"]
+    raise ApiError(404, f"Unknown symbol {symbol}")
+
+def build_resource(market_data: Dict[str, Any], snapshot: Snapshot, parts: List[str],
+                   query: Dict[str, List[str]], fmt: str) -> Tuple[bytes, str]:
+    """
+    Renders one API resource from the computed state.
+
+    :param market_data: Market data dictionary from the snapshot.
+    :param snapshot: Snapshot the market data was loaded from.
+    :param parts: Path segments after /api/v1.
+    :param query: Parsed query string.
+    :param fmt: "json" or "arrow".
+    :return: Tuple of (body, content type).
+    :raises ApiError: For unknown resources or unsupported formats.
+    """
+    if parts == ["meta"]:
+        return _json_body({
+            "as_of": snapshot.info.created_at.isoformat(),
+            "config_hash": snapshot.info.config_hash,
+            "symbols": list(market_data["raw_data"]),
+            "timeframes": market_data["timeframes"],
+        })
+
+    if len(parts) == 2 and parts[0] == "series":
+        symbol = parts[1]
+        frame = _price_frame(market_data, symbol)
+        if fmt == "arrow":
+            return _arrow_body(frame.rename_axis("time").reset_index())
+        return _json_body({"symbol": symbol, **_frame_json(frame)})
+
+    if parts == ["correlations"]:
+        statistic = _statistic(query)
+        correlations = _correlations(market_data, _windows(query), statistic)
+        if fmt == "arrow":
+            rows = [(symbol, int(window), float(value))
+                    for symbol, series in correlations.items() for window, value in series.items()]
+            return _arrow_body(pd.DataFrame(rows, columns=["symbol", "window", statistic]))
+        return _json_body({
+            symbol: {str(window): (None if pd.isna(value) else float(value)) for window, value in series.items()}
+            for symbol, series in correlations.items()
+        })
+
+    if len(parts) == 2 and parts[0] == "charts":
+        if fmt == "arrow":
+            raise ApiError(406, "Chart payloads are only available as JSON")
+        if parts[1] == "correlation":
+            return _json_body(create_correlation_chart(_correlations(market_data, _windows(query), _statistic(query))))
+        if parts[1] == "price":
+            btc_prices = get_price_series(market_data["bitcoin_data"])
+            if query.get("mode", ["lines"])[0] == "envelope":
+                highlighted = [s for s in query.get("highlight", [""])[0].split(",") if s]
+                return _json_body(create_envelope_chart(btc_prices, market_data["raw_data"], highlighted))
+            return _json_body(create_multi_asset_chart(btc_prices, market_data["raw_data"]))
+
+    raise ApiError(404, "Unknown resource")
+
+def make_handler(state: ComputedState):
+    """Creates a request handler class bound to a ComputedState."""
+
+    class ApiHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            try:
+                self._serve()
+            except ApiError as e:
+                self._send(e.status, *_json_body({"error": e.message}))
+            except Exception:
+                logger.exception("Failed to serve %s", self.path)
+                self._send(500, *_json_body({"error": "Internal server error"}))
+
+        def _serve(self):
+            url = urlsplit(self.path)
+            segments = [unquote(part) for part in url.path.split("/") if part]
+            if segments[:2] != ["api", "v1"]:
+                raise ApiError(404, "Unknown resource")
+            parts = segments[2:]
+            query = parse_qs(url.query)
+            fmt = query.pop("format", [None])[0]
+            if fmt is None:
+                fmt = "arrow" if ARROW_TYPE in self.headers.get("Accept", "") else "json"
+
+            snapshot, version = state.current()
+            resource = (tuple(parts), tuple(sorted((k, tuple(v)) for k, v in query.items())), fmt)
+            # Weak validator: the same entity is served gzip-encoded or not
+            etag = 'W/"%s"' % hashlib.sha1(repr((version, resource)).encode("utf-8")).hexdigest()
+
+            if_none_match = self.headers.get("If-None-Match", "")
+            if if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]:
+                self._send(304, b"", None, etag)
+                return
+
+            body, content_type = state.response(
+                (version, resource),
+                lambda: build_resource(snapshot.state, snapshot, parts, query, fmt)
+            )
+            encoding = None
+            if len(body) >= GZIP_MIN_BYTES and accepts_gzip(self.headers.get("Accept-Encoding", "")):
+                body, _ = state.response(
+                    (version, resource, "gzip"),
+                    lambda: (gzip.compress(body, compresslevel=6), content_type)
+                )
+                encoding = "gzip"
+            self._send(200, body, content_type, etag, encoding)
+
+        def _send(self, status: int, body: bytes, content_type: Optional[str],
+                  etag: Optional[str] = None, encoding: Optional[str] = None):
+            self.send_response(status)
+            if content_type is not None:
+                self.send_header("Content-Type", content_type)
+            if etag is not None:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Vary", "Accept, Accept-Encoding")
+            if encoding is not None:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Keep the console quiet; clients poll frequently
+            pass
+
+    return ApiHandler
+
+def create_server(host: str = API_HOST, port: int = API_PORT, snapshot_path: str = SNAPSHOT_PATH) -> ThreadingHTTPServer:
+    """
+    Creates the API server without starting it.
+
+    :param host: Interface to bind; defaults to localhost only.
+    :param port: Port to bind; 0 picks a free port.
+    :param snapshot_path: Snapshot file to serve.
+    :return: ThreadingHTTPServer instance.
+    """
+    return ThreadingHTTPServer((host, port), make_handler(ComputedState(snapshot_path)))
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--snapshot", default=SNAPSHOT_PATH)
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.snapshot)
+    print(f"Serving {args.snapshot} on http://{args.host}:{server.server_port}/api/v1/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Offline benchmark of the market data pipeline.
+
+Record the configured universe once from TradingView, then replay it any number of
+times without a network, with simulated per-request latency, jitter and failures.
+Reports pipeline throughput and tail latency. Run from the project root:
+
+    python src/bench_pipeline.py --record
+    python src/bench_pipeline.py --runs 20 --latency 0.2 --jitter 0.1 --failure-rate 0.01 --seed 1
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Any, Dict, List, Optional, Sequence
+
+from config.readConfig import MacroTicker, read_config, config_hash
+from datafeed.datafeed import TvClient
+from datafeed.replay import FIXTURE_DIR, RecordingClient, ReplayClient
+from pipeline import StageTimer, process_market_data
+
+CONFIG_PATH = 'MacroTickers.yaml'
+
+def percentiles(values: Sequence[float], qs: Sequence[float] = (50, 95, 99)) -> Dict[str, Optional[float]]:
+    """
+    Returns nearest-rank percentiles of a sample.
+
+    :param values: Observed values.
+    :param qs: Percentiles to report, in [0, 100].
+    :return: Dictionary such as {"p50": ..., "p95": ..., "p99": ...}; None values for an empty sample.
+    """
+    ordered = sorted(values)
+    result = {}
+    for q in qs:
+        if not ordered:
+            result[f"p{q:g}"] = None
+            continue
+        rank = max(1, -(-len(ordered) * q // 100))
+        result[f"p{q:g}"] = ordered[int(rank) - 1]
+    return result
+
+def record_fixtures(config: List[MacroTicker], fixture_dir: str = FIXTURE_DIR) -> List[str]:
+    """
+    Runs the pipeline once against TradingView and records every response.
+
+    :param config: List of MacroTicker objects to fetch.
+    :param fixture_dir: Directory the fixtures are written to.
+    :return: Paths of the recorded fixtures.
+    """
+    client = RecordingClient(TvClient(), fixture_dir)
+    process_market_data(config, config_hash(config), client=client)
+    return client.recorded
+
+def run_benchmark(config: List[MacroTicker], client: ReplayClient, runs: int) -> Dict[str, Any]:
+    """
+    Runs the full pipeline repeatedly against a replay client.
+
+    A run that hits an injected failure is counted as failed, the way the worker
+    would drop it and keep the previous version.
+
+    :param config: List of MacroTicker objects to fetch.
+    :param client: ReplayClient serving the recorded fixtures.
+    :param runs: Number of pipeline runs.
+    :return: Throughput, run and request latency percentiles, and mean stage timings.
+    """
+    digest = config_hash(config)
+    durations: List[float] = []
+    stages: Dict[str, float] = {}
+    failed_runs = 0
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        timer = StageTimer()
+        run_start = time.perf_counter()
+        try:
+            process_market_data(config, digest, timer, client=client)
+        except ConnectionError:
+            failed_runs += 1
+            continue
+        durations.append(time.perf_counter() - run_start)
+        for name, seconds in timer.stages.items():
+            stages[name] = stages.get(name, 0.0) + seconds
+    elapsed = time.perf_counter() - start
+
+    completed = len(durations)
+    return {
+        "runs": runs,
+        "completed_runs": completed,
+        "failed_runs": failed_runs,
+        "elapsed_seconds": elapsed,
+        "runs_per_minute": 60.0 * completed / elapsed if elapsed else None,
+        "requests": client.requests,
+        "requests_per_second": client.requests / elapsed if elapsed else None,
+        "injected_failures": client.failures,
+        "run_seconds": percentiles(durations),
+        "request_delay_seconds": percentiles(client.delays),
+        "mean_stage_seconds": {name: seconds / completed for name, seconds in stages.items()} if completed else {},
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=CONFIG_PATH)
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="fixture directory")
+    parser.add_argument("--record", action="store_true", help="record fixtures from TradingView and exit")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="fixed delay per request (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="mean extra delay per request (seconds)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="probability a request fails")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=os.path.join(".cache", "bench_pipeline.json"), help="report path")
+    args = parser.parse_args(argv)
+
+    config = read_config(args.config)
+    if args.record:
+        recorded = record_fixtures(config, args.fixtures)
+        print(f"Recorded {len(recorded)} fixtures to {args.fixtures}")
+        return 0
+
+    client = ReplayClient(args.fixtures, latency=args.latency, jitter=args.jitter,
+                          failure_rate=args.failure_rate, seed=args.seed)
+    report = run_benchmark(config, client, args.runs)
+    report["settings"] = {"latency": args.latency, "jitter": args.jitter,
+                          "failure_rate": args.failure_rate, "seed": args.seed, "tickers": len(config) + 1}
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    run_seconds = report["run_seconds"]
+    print(f"{report['completed_runs']}/{report['runs']} runs completed, "
+          f"{report['requests_per_second']:.1f} requests/s, {report['runs_per_minute']:.1f} runs/min")
+    if run_seconds["p50"] is not None:
+        print(f"  run p50 {run_seconds['p50']:.3f}s  p95 {run_seconds['p95']:.3f}s  p99 {run_seconds['p99']:.3f}s")
+    for name, seconds in report["mean_stage_seconds"].items():
+        print(f"  {name:8s} {seconds:.3f}s mean")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
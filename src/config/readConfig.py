@@ -1,6 +1,13 @@
+import os
+import json
+import hashlib
 import yaml
-from typing import List
-from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field, asdict
+
+# Keys of a ticker entry that are fields of MacroTicker rather than options
+_TICKER_FIELDS = ('ticker', 'frequency')
 
 @dataclass
 class MacroTicker:
@@ -9,27 +16,192 @@ class MacroTicker:
 
     :param symbol: The ticker symbol.
     :param frequency: The frequency of the data (e.g., "D", "W", "M").
+    :param group: Name of the group the ticker was declared in, if any.
+    :param options: Per-ticker options (e.g. "since"), group options included.
     """
     symbol: str
     frequency: str
-    
-    
+    group: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """
+        Identity of the ticker across config versions.
+
+        :return: Tuple of (symbol, frequency).
+        """
+        return (self.symbol, self.frequency)
+
+@dataclass
+class ConfigDiff:
+    """
+    Data class describing how the ticker universe changed between two configs.
+
+    :param added: Tickers only present in the new config.
+    :param removed: Tickers only present in the old config.
+    :param changed: Tickers present in both whose group or options differ (new version).
+    :param unchanged: Tickers identical in both configs.
+    """
+    added: List[MacroTicker] = field(default_factory=list)
+    removed: List[MacroTicker] = field(default_factory=list)
+    changed: List[MacroTicker] = field(default_factory=list)
+    unchanged: List[MacroTicker] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        :return: True if nothing needs to be fetched or evicted.
+        """
+        return not (self.added or self.removed or self.changed)
+
+def _parse_since(value: Any, symbol: Optional[str]) -> str:
+    """
+    Normalizes a "since" option to a "YYYY-MM-DD" string.
+
+    YAML parses an unquoted date such as 2020-01-01 into a date object, while the
+    data feed expects the quoted string form.
+
+    :param value: Option value as parsed from YAML.
+    :param symbol: Ticker the option belongs to, for error messages.
+    :return: ISO date string.
+    :raises ValueError: If the value is not a date.
+    """
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        raise ValueError(f"Invalid since option {value!r} for ticker {symbol}; expected YYYY-MM-DD")
+
+def _parse_ticker(item: Dict[str, Any], group: Optional[str] = None, defaults: Optional[Dict[str, Any]] = None) -> MacroTicker:
+    """
+    Builds a MacroTicker from a YAML entry, merging group defaults into its options.
+
+    :param item: Ticker entry from the YAML file.
+    :param group: Name of the enclosing group, if any.
+    :param defaults: Group-level options; the ticker's own options take precedence.
+    :return: MacroTicker object.
+    """
+    options = dict(defaults or {})
+    options.update({key: value for key, value in item.items() if key not in _TICKER_FIELDS})
+    if 'since' in options:
+        options['since'] = _parse_since(options['since'], item.get('ticker'))
+    return MacroTicker(
+        symbol=item.get('ticker'),
+        frequency=item.get('frequency'),
+        group=group,
+        options=options
+    )
 
 def read_config(file_path: str) -> List[MacroTicker]:
     """
     Reads a YAML configuration file and returns a list of MacroTicker objects.
 
+    Tickers may be listed at the top level under "tickers" and/or inside named
+    entries under "groups". Any key of a group other than "tickers" is an option
+    inherited by its tickers; any key of a ticker other than "ticker" and
+    "frequency" is an option of that ticker.
+
     :param file_path: Path to the YAML configuration file.
     :return: List of MacroTicker objects.
+    :raises ValueError: If a symbol is configured more than once.
     """
     with open(file_path, 'r') as file:
-        config_data = yaml.safe_load(file)
+        config_data = yaml.safe_load(file) or {}
 
     tickers = []
-    for item in config_data.get('tickers', []):
-        tickers.append(MacroTicker(
-            symbol=item.get('ticker'),
-            frequency=item.get('frequency')
-        ))
+    for item in config_data.get('tickers') or []:
+        tickers.append(_parse_ticker(item))
+
+    for group, group_data in (config_data.get('groups') or {}).items():
+        group_data = group_data or {}
+        defaults = {key: value for key, value in group_data.items() if key != 'tickers'}
+        for item in group_data.get('tickers') or []:
+            tickers.append(_parse_ticker(item, group, defaults))
+
+    # Market data is stored per symbol, so a symbol may appear only once (at one frequency)
+    seen = set()
+    for ticker in tickers:
+        if ticker.symbol in seen:
+            raise ValueError(f"Ticker {ticker.symbol} is configured more than once in {file_path}")
+        seen.add(ticker.symbol)
+
+    return tickers
+
+def config_hash(tickers: List[MacroTicker]) -> str:
+    """
+    Computes a content hash of a ticker universe.
+
+    The hash covers the parsed tickers only, so comments and formatting changes
+    in the YAML file do not invalidate caches.
+
+    :param tickers: List of MacroTicker objects.
+    :return: Hex SHA-256 digest.
+    """
+    canonical = json.dumps([asdict(ticker) for ticker in tickers], sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def diff_config(old: List[MacroTicker], new: List[MacroTicker]) -> ConfigDiff:
+    """
+    Compares two ticker universes keyed by (symbol, frequency).
+
+    :param old: Tickers of the previous config.
+    :param new: Tickers of the current config.
+    :return: ConfigDiff describing added, removed, changed and unchanged tickers.
+    """
+    old_by_key = {ticker.key: ticker for ticker in old}
+    new_by_key = {ticker.key: ticker for ticker in new}
+
+    diff = ConfigDiff()
+    for key, ticker in new_by_key.items():
+        if key not in old_by_key:
+            diff.added.append(ticker)
+        elif old_by_key[key] != ticker:
+            diff.changed.append(ticker)
+        else:
+            diff.unchanged.append(ticker)
+    diff.removed = [ticker for key, ticker in old_by_key.items() if key not in new_by_key]
+    return diff
+
+class ConfigWatcher:
+    """
+    Watches a YAML configuration file and re-reads it only when it changes on disk.
+
+    An edit that cannot be read (a YAML syntax error, a duplicate ticker, an invalid
+    option) leaves the last valid universe in place; the failure is kept in `error`
+    until the file is fixed.
+
+    :param file_path: Path to the YAML configuration file.
+    """
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._stamp = None
+        self._tickers: List[MacroTicker] = []
+        self._hash: Optional[str] = None
+        self.error: Optional[Exception] = None
+
+    def current(self) -> Tuple[List[MacroTicker], str]:
+        """
+        Returns the current universe, re-parsing the file only if its modification
+        time or size changed since the last call.
 
-    return tickers
\ No newline at end of file
+        :return: Tuple of (tickers, content hash) of the last valid config.
+        :raises OSError, yaml.YAMLError, ValueError: If the file has never been read successfully.
+        """
+        try:
+            stat = os.stat(self.file_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp != self._stamp:
+                self._stamp = stamp
+                tickers = read_config(self.file_path)
+                self._tickers, self._hash = tickers, config_hash(tickers)
+                self.error = None
+        except (OSError, yaml.YAMLError, ValueError) as e:
+            if self._hash is None:
+                self._stamp = None
+                raise
+            self.error = e
+        return self._tickers, self._hash
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from typing import Dict, List, Union, Tuple, cast
+from .quality import get_price_column
 
 # Define the expected data structure type
 PriceDataFrame = pd.DataFrame  # DataFrame with required price columns
@@ -11,6 +13,10 @@ def validate_price_dataframe(df: pd.DataFrame, name: str = "dataframe") -> None:
     if not isinstance(df, pd.DataFrame):
         raise TypeError(f"Expected {name} to be a pandas DataFrame, got {type(df).__name__}")
     
+    # Frames cleaned by the ingest quality stage record their price column; nothing left to check
+    if get_price_column(df) is not None:
+        return
+    
     if 'close' not in df.columns and 'Close' not in df.columns:
         # Try to find numeric columns
         numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
@@ -24,6 +30,10 @@ def get_price_series(df: pd.DataFrame) -> pd.Series:
     """
     validate_price_dataframe(df)
     
+    price_column = get_price_column(df)
+    if price_column is not None:
+        return df[price_column]
+    
     if 'close' in df.columns:
         return df['close']
     elif 'Close' in df.columns:
@@ -76,10 +86,13 @@ def calculate_average_correlation(asset_data: pd.DataFrame, btc_data: pd.DataFra
     validate_price_dataframe(asset_data, "asset_data")
     validate_price_dataframe(btc_data, "btc_data")
     
+    # Extract price series once for all windows
+    asset_series = get_price_series(asset_data)
+    btc_series = get_price_series(btc_data)
+    
     correlations = {}
     for window in windows:
-        corr = calculate_fixed_window_correlation(asset_data, btc_data, window)
-        correlations[window] = corr
+        correlations[window] = asset_series.iloc[-window:].corr(btc_series.iloc[-window:])
     return pd.Series(correlations)
 
 def multi_timeframe_sliding_correlation(
@@ -110,4 +123,252 @@ def multi_timeframe_sliding_correlation(
         avg_corr = calculate_average_correlation(asset_data, btc_data, windows)
         avg_correlations[symbol] = avg_corr
     
-    return avg_correlations
\ No newline at end of file
+    return avg_correlations
+
+# Statistics answered by MomentIndex. Correlation is measured on price levels, like
+# calculate_fixed_window_correlation; the others on log returns, the way beta and
+# volatility are quoted.
+STATISTICS = ['correlation', 'beta', 'covariance', 'asset_volatility', 'btc_volatility', 'volatility_ratio']
+
+
+@dataclass
+class PairMoments:
+    """Prefix sums of the first and second moments of two aligned series.
+
+    Attributes:
+        count: Number of valid observations
+        sum_x, sum_y, sum_xx, sum_yy, sum_xy: Sums of x, y, x², y² and xy over the
+            valid observations, on mean-centred values to keep the subtraction
+            numerically stable
+
+    All arrays have a leading zero, so the moments of positions [i, j) are
+    `array[j] - array[i]`.
+    """
+    count: np.ndarray
+    sum_x: np.ndarray
+    sum_y: np.ndarray
+    sum_xx: np.ndarray
+    sum_yy: np.ndarray
+    sum_xy: np.ndarray
+
+    def window(self, starts: np.ndarray, stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Observation count, sums of squares and sum of cross products about the means of each range."""
+        n = (self.count[stops] - self.count[starts]).astype('float64')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sx = self.sum_x[stops] - self.sum_x[starts]
+            sy = self.sum_y[stops] - self.sum_y[starts]
+            ss_x = np.maximum((self.sum_xx[stops] - self.sum_xx[starts]) - sx * sx / n, 0.0)
+            ss_y = np.maximum((self.sum_yy[stops] - self.sum_yy[starts]) - sy * sy / n, 0.0)
+            sp = (self.sum_xy[stops] - self.sum_xy[starts]) - sx * sy / n
+        return n, ss_x, ss_y, sp
+
+
+@dataclass
+class MomentIndex:
+    """Prefix-sum index of the moments of an (asset, BTC) pair.
+
+    Built once per pair, it holds the prefix sums of the date-aligned prices and of
+    their log returns, so any window or date range is answered in constant time
+    from two lookups: the correlation from the prices, and the beta to BTC, the
+    covariance and both volatilities from the returns.
+
+    Attributes:
+        dates: Dates on which both series have a price
+        asset_dates: Full index of the asset series, used to resolve trailing windows
+        btc_dates: Full index of the Bitcoin series, used to resolve trailing windows
+        prices: Moments of the aligned prices
+        returns: Moments of the log returns between consecutive aligned dates; the
+            return at position i runs from dates[i - 1] to dates[i]
+    """
+    dates: pd.Index
+    asset_dates: pd.Index
+    btc_dates: pd.Index
+    prices: PairMoments
+    returns: PairMoments
+
+    def _window_start(self, window: int) -> int:
+        """Position in `dates` of the first pair inside the trailing window.
+
+        Mirrors `calculate_fixed_window_correlation`, which takes the last `window`
+        rows of each series independently and correlates their overlap.
+        """
+        if window <= 0 or len(self.dates) == 0:
+            return len(self.dates)
+        asset_start = self.asset_dates[-min(window, len(self.asset_dates))]
+        btc_start = self.btc_dates[-min(window, len(self.btc_dates))]
+        return int(self.dates.searchsorted(max(asset_start, btc_start), side='left'))
+
+    def _statistics(self, starts: np.ndarray, stops: np.ndarray) -> Dict[str, np.ndarray]:
+        """All statistics for the aligned pairs in positions [start, stop), vectorized over ranges.
+
+        The returns inside a range are those ending on its dates after the first,
+        so a window of n prices holds n - 1 returns.
+        """
+        starts = np.asarray(starts, dtype='int64')
+        stops = np.asarray(stops, dtype='int64')
+        
+        n, ss_x, ss_y, sp = self.prices.window(starts, stops)
+        correlated = (n >= 2) & (ss_x > 0) & (ss_y > 0)
+        
+        rn, rss_x, rss_y, rsp = self.returns.window(np.minimum(starts + 1, stops), stops)
+        enough = rn >= 2
+        btc_varies = enough & (rss_y > 0)
+        nan = np.full(rn.shape, np.nan)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dof = np.where(enough, rn - 1, np.nan)
+            asset_volatility = np.sqrt(rss_x / dof)
+            btc_volatility = np.sqrt(rss_y / dof)
+            return {
+                'correlation': np.where(correlated, np.clip(sp / np.sqrt(ss_x * ss_y), -1.0, 1.0), np.full(n.shape, np.nan)),
+                'beta': np.where(btc_varies, rsp / rss_y, nan),
+                'covariance': np.where(enough, rsp / dof, nan),
+                'asset_volatility': asset_volatility,
+                'btc_volatility': btc_volatility,
+                'volatility_ratio': np.where(btc_varies, asset_volatility / btc_volatility, nan),
+            }
+
+    def _date_range(self, start=None, end=None) -> Tuple[int, int]:
+        lo = 0 if start is None else int(self.dates.searchsorted(pd.Timestamp(start), side='left'))
+        hi = len(self.dates) if end is None else int(self.dates.searchsorted(pd.Timestamp(end), side='right'))
+        return lo, max(lo, hi)
+
+    def correlation(self, window: int) -> float:
+        """Correlation over the last `window` rows, same semantics as `calculate_fixed_window_correlation`."""
+        return float(self._statistics([self._window_start(window)], [len(self.dates)])['correlation'][0])
+
+    def correlation_between(self, start=None, end=None) -> float:
+        """Correlation over an inclusive date range; open ends default to the full history."""
+        lo, hi = self._date_range(start, end)
+        return float(self._statistics([lo], [hi])['correlation'][0])
+
+    def correlations(self, windows: List[int]) -> pd.Series:
+        """Correlations indexed by window size, same shape as `calculate_average_correlation`."""
+        return self.statistics(windows)['correlation']
+
+    def statistics(self, windows: List[int]) -> pd.DataFrame:
+        """All statistics for each trailing window.
+        
+        Parameters:
+            windows: List of window sizes
+            
+        Returns:
+            DataFrame indexed by window size with one column per name in STATISTICS;
+            covariance and volatilities are per bar of log returns and use the sample
+            (n - 1) convention like pandas
+        """
+        starts = [self._window_start(window) for window in windows]
+        stops = [len(self.dates)] * len(windows)
+        return pd.DataFrame(self._statistics(starts, stops), index=pd.Index(windows, dtype='int64'), columns=STATISTICS)
+
+    def statistics_between(self, start=None, end=None) -> pd.Series:
+        """All statistics over an inclusive date range, indexed by statistic name."""
+        lo, hi = self._date_range(start, end)
+        values = self._statistics([lo], [hi])
+        return pd.Series({name: float(values[name][0]) for name in STATISTICS}, dtype='float64')
+
+
+def _prefix_sum(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum with a leading zero so that sum[i:j] == prefix[j] - prefix[i]."""
+    return np.concatenate(([0.0], np.cumsum(values)))
+
+
+def _pair_moments(x: np.ndarray, y: np.ndarray) -> PairMoments:
+    """Prefix-sum moments of two aligned arrays; pairs with a non-finite value are skipped."""
+    valid = np.isfinite(x) & np.isfinite(y)
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+    if valid.any():
+        x = np.where(valid, x - x[valid].mean(), 0.0)
+        y = np.where(valid, y - y[valid].mean(), 0.0)
+    return PairMoments(
+        count=np.concatenate(([0], np.cumsum(valid))),
+        sum_x=_prefix_sum(x),
+        sum_y=_prefix_sum(y),
+        sum_xx=_prefix_sum(x * x),
+        sum_yy=_prefix_sum(y * y),
+        sum_xy=_prefix_sum(x * y),
+    )
+
+
+def _log_returns(prices: np.ndarray) -> np.ndarray:
+    """Log returns aligned with `prices`: NaN at the first position and wherever a price is not positive."""
+    returns = np.full(len(prices), np.nan)
+    if len(prices) > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns[1:] = np.diff(np.log(np.where(prices > 0, prices, np.nan)))
+    return returns
+
+
+def build_moment_index(asset_data: pd.DataFrame, btc_data: pd.DataFrame) -> MomentIndex:
+    """Build the prefix-sum moment index for one asset against Bitcoin.
+    
+    Parameters:
+        asset_data: DataFrame containing price data for the asset
+        btc_data: DataFrame containing price data for Bitcoin
+        
+    Returns:
+        MomentIndex answering window and date-range queries in O(1)
+    """
+    asset_series = get_price_series(asset_data)
+    btc_series = get_price_series(btc_data)
+    
+    # Pair up observations the same way Series.corr does: inner join on dates, drop NaNs
+    aligned = pd.concat([asset_series, btc_series], axis=1, join='inner').dropna()
+    x = aligned.iloc[:, 0].to_numpy(dtype='float64')
+    y = aligned.iloc[:, 1].to_numpy(dtype='float64')
+    
+    return MomentIndex(
+        dates=aligned.index,
+        asset_dates=asset_series.index,
+        btc_dates=btc_series.index,
+        prices=_pair_moments(x, y),
+        returns=_pair_moments(_log_returns(x), _log_returns(y)),
+    )
+
+
+def build_moment_indexes(assets_dict: Dict[str, pd.DataFrame], btc_data: pd.DataFrame) -> Dict[str, MomentIndex]:
+    """Build a moment index for every asset against Bitcoin.
+    
+    Parameters:
+        assets_dict: Dictionary mapping asset symbols to their price DataFrames
+        btc_data: DataFrame containing price data for Bitcoin
+        
+    Returns:
+        Dictionary mapping asset symbols to their MomentIndex
+    """
+    validate_price_dataframe(btc_data, "btc_data")
+    
+    indexes: Dict[str, MomentIndex] = {}
+    for symbol, asset_data in assets_dict.items():
+        validate_price_dataframe(asset_data, f"assets_dict[{symbol}]")
+        indexes[symbol] = build_moment_index(asset_data, btc_data)
+    return indexes
+
+
+def window_correlations(indexes: Dict[str, MomentIndex], windows: List[int]) -> Dict[str, pd.Series]:
+    """Answer a set of window lengths for every asset from precomputed moment indexes.
+    
+    Parameters:
+        indexes: Dictionary mapping asset symbols to their MomentIndex
+        windows: List of window sizes to calculate correlations for
+        
+    Returns:
+        Dictionary mapping asset symbols to their correlation series, as returned
+        by `multi_timeframe_sliding_correlation`
+    """
+    return {symbol: index.correlations(windows) for symbol, index in indexes.items()}
+
+
+def window_statistics(indexes: Dict[str, MomentIndex], windows: List[int]) -> Dict[str, pd.DataFrame]:
+    """Answer every statistic for a set of window lengths for every asset.
+    
+    Parameters:
+        indexes: Dictionary mapping asset symbols to their MomentIndex
+        windows: List of window sizes
+        
+    Returns:
+        Dictionary mapping asset symbols to a DataFrame indexed by window size
+        with one column per name in STATISTICS
+    """
+    return {symbol: index.statistics(windows) for symbol, index in indexes.items()}
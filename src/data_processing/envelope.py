@@ -0,0 +1,47 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Iterable
+from .correlation import get_price_series
+
+# Cross-sectional percentiles drawn by the envelope overlay
+DEFAULT_PERCENTILES = [10, 25, 50, 75, 90]
+
+def normalized_universe(assets_dict: Dict[str, pd.DataFrame], exclude: Iterable[str] = ()) -> pd.DataFrame:
+    """Align every asset on a common date index and normalize each to the 0-1 range.
+    
+    Parameters:
+        assets_dict: Dictionary mapping asset symbols to their price DataFrames
+        exclude: Symbols to leave out of the matrix (e.g. Bitcoin itself)
+        
+    Returns:
+        DataFrame with one column per asset; lower-frequency series are carried
+        forward between their own bars
+    """
+    excluded = set(exclude)
+    prices = {symbol: get_price_series(df) for symbol, df in assets_dict.items() if symbol not in excluded}
+    if not prices:
+        return pd.DataFrame()
+    
+    matrix = pd.concat(prices, axis=1).sort_index().ffill()
+    low, high = matrix.min(), matrix.max()
+    return (matrix - low) / (high - low)
+
+def percentile_bands(matrix: pd.DataFrame, percentiles: List[float] = DEFAULT_PERCENTILES) -> pd.DataFrame:
+    """Compute cross-sectional percentiles of a normalized universe matrix.
+    
+    Parameters:
+        matrix: Aligned, normalized universe as returned by `normalized_universe`
+        percentiles: Percentiles to compute, in the 0-100 range
+        
+    Returns:
+        DataFrame indexed by date with one column per percentile, named e.g. "p10";
+        its size depends on the number of percentiles, not on the number of assets
+    """
+    columns = [f"p{p:g}" for p in percentiles]
+    values = matrix.to_numpy(dtype='float64')
+    populated = ~np.isnan(values).all(axis=1)
+    if not populated.any():
+        return pd.DataFrame(columns=columns, dtype='float64')
+    
+    bands = np.nanpercentile(values[populated], percentiles, axis=1)
+    return pd.DataFrame(bands.T, index=matrix.index[populated], columns=columns)
@@ -0,0 +1,161 @@
+import pandas as pd
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Any, Optional
+
+# Key under which the ingest stage records the resolved price column in DataFrame.attrs.
+# pandas deep-copies attrs onto every derived frame and series, so nothing larger
+# (such as the quality report) is stored there.
+PRICE_COLUMN_ATTR = "price_column"
+
+@dataclass
+class QualityReport:
+    """Findings of the ingest-time quality stage for a single price series.
+
+    Attributes:
+        name: Name of the series (usually the ticker symbol)
+        rows_in: Number of rows received
+        rows_out: Number of rows kept after dropping duplicate timestamps
+        duplicates: Number of duplicate timestamps dropped (last print kept)
+        non_monotonic: Whether the index had to be sorted
+        non_positive: Number of zero or negative prices masked as missing
+        outliers: Number of isolated spikes (bad prints) masked as missing
+        missing: Number of missing prices after cleaning
+        gaps: (previous, next) timestamps around spacing gaps larger than expected
+    """
+    name: str
+    rows_in: int
+    rows_out: int
+    duplicates: int = 0
+    non_monotonic: bool = False
+    non_positive: int = 0
+    outliers: int = 0
+    missing: int = 0
+    gaps: List[Tuple[pd.Timestamp, pd.Timestamp]] = field(default_factory=list)
+
+    @property
+    def is_clean(self) -> bool:
+        """True when the series needed no repair and has no gaps."""
+        return not (self.duplicates or self.non_monotonic or self.non_positive
+                    or self.outliers or self.missing or self.gaps)
+
+    def summary(self) -> Dict[str, Any]:
+        """Flat representation suitable for a table row."""
+        return {
+            "name": self.name,
+            "rows": self.rows_out,
+            "duplicates": self.duplicates,
+            "non_monotonic": self.non_monotonic,
+            "non_positive": self.non_positive,
+            "outliers": self.outliers,
+            "missing": self.missing,
+            "gaps": len(self.gaps),
+        }
+
+def resolve_price_column(df: pd.DataFrame, name: str = "dataframe") -> str:
+    """Pick the price column: 'close', 'Close', then the first numeric column."""
+    if 'close' in df.columns:
+        return 'close'
+    if 'Close' in df.columns:
+        return 'Close'
+    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+    if len(numeric_cols) == 0:
+        raise ValueError(f"{name} must contain a 'close', 'Close', or at least one numeric column")
+    return numeric_cols[0]
+
+def _bad_print_mask(prices: pd.Series, threshold: float) -> pd.Series:
+    """Flag isolated spikes: an extreme log return immediately reversed by another.
+
+    Returns are scored against a robust (median/MAD) scale so genuine trends and
+    regime changes are not mistaken for bad prints.
+    """
+    valid = prices.dropna()
+    mask = pd.Series(False, index=prices.index)
+    if len(valid) < 3:
+        return mask
+
+    returns = np.diff(np.log(valid.to_numpy(dtype='float64')))
+    deviation = np.abs(returns - np.median(returns))
+    scale = 1.4826 * np.median(deviation)
+    if scale == 0:
+        return mask
+
+    extreme = deviation / scale > threshold
+    # returns[i] leads into valid[i + 1]; a bad print has extreme moves in and out, in opposite directions
+    spike = extreme[:-1] & extreme[1:] & (np.sign(returns[:-1]) != np.sign(returns[1:]))
+    mask.loc[valid.index[1:-1][spike]] = True
+    return mask
+
+def _find_gaps(index: pd.Index, gap_factor: float) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Locate spacings larger than `gap_factor` times the median spacing."""
+    if not isinstance(index, pd.DatetimeIndex) or len(index) < 3:
+        return []
+
+    spacing = np.diff(index.asi8)
+    limit = gap_factor * np.median(spacing)
+    positions = np.flatnonzero(spacing > limit)
+    return [(index[i], index[i + 1]) for i in positions]
+
+def clean_price_dataframe(
+    df: pd.DataFrame,
+    name: str = "dataframe",
+    outlier_threshold: float = 10.0,
+    gap_factor: float = 5.0
+) -> Tuple[pd.DataFrame, QualityReport]:
+    """Validate and clean a price DataFrame once, at ingest.
+
+    Sorts the index, drops duplicate timestamps, masks non-positive prices and
+    isolated bad prints as missing, and records gaps. The resolved price column
+    is recorded in the returned frame's `attrs`, which lets
+    `validate_price_dataframe` and `get_price_series` skip their checks.
+
+    Parameters:
+        df: Raw price DataFrame as returned by the data feed
+        name: Name used in error messages and the report
+        outlier_threshold: Robust z-score above which a reversed return marks a bad print
+        gap_factor: Multiple of the median bar spacing above which a spacing is a gap
+
+    Returns:
+        Tuple of the cleaned copy of the DataFrame and its QualityReport
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError(f"Expected {name} to be a pandas DataFrame, got {type(df).__name__}")
+
+    price_column = resolve_price_column(df, name)
+    report = QualityReport(name=name, rows_in=len(df), rows_out=len(df))
+
+    if not df.index.is_monotonic_increasing:
+        report.non_monotonic = True
+        df = df.sort_index(kind='stable')
+
+    duplicated = df.index.duplicated(keep='last')
+    report.duplicates = int(duplicated.sum())
+    cleaned = df.loc[~duplicated].copy() if report.duplicates else df.copy()
+    report.rows_out = len(cleaned)
+
+    prices = cleaned[price_column].astype('float64')
+    non_positive = prices <= 0
+    report.non_positive = int(non_positive.sum())
+    prices = prices.mask(non_positive)
+
+    bad_prints = _bad_print_mask(prices, outlier_threshold)
+    report.outliers = int(bad_prints.sum())
+    prices = prices.mask(bad_prints)
+
+    cleaned[price_column] = prices
+    report.missing = int(prices.isna().sum())
+    report.gaps = _find_gaps(cleaned.index, gap_factor)
+
+    cleaned.attrs[PRICE_COLUMN_ATTR] = price_column
+    return cleaned, report
+
+def get_price_column(df: pd.DataFrame) -> Optional[str]:
+    """Return the price column recorded at ingest if the frame still has it, else None.
+
+    pandas copies attrs onto derived frames, so a frame produced by column selection
+    or a rename can carry a column name it no longer contains.
+    """
+    price_column = df.attrs.get(PRICE_COLUMN_ATTR)
+    if price_column is None or price_column not in df.columns:
+        return None
+    return price_column
@@ -1,23 +1,39 @@
-from tvDatafeed import TvDatafeed, Interval
 import pandas as pd
 from enum import Enum
 from datetime import datetime
 
 class DataInterval(Enum):
-    ONE_DAY = Interval.in_daily
-    ONE_WEEK = Interval.in_weekly
-    ONE_MONTH = Interval.in_monthly
+    # Values of the matching tvDatafeed Interval members. tvDatafeed itself is only
+    # imported when a live client is created, so recorded data replays without it.
+    ONE_DAY = "1D"
+    ONE_WEEK = "1W"
+    ONE_MONTH = "1M"
+
+class TvClient:
+    """Live TradingView client: TvDatafeed taking interval values such as "1D".
+
+    Every client passed to TradingViewDataFeed gets intervals as plain values, so the
+    record/replay clients in datafeed.replay never need tvDatafeed installed.
+    """
+    def __init__(self, tv=None):
+        from tvDatafeed import TvDatafeed
+        self.tv = tv if tv is not None else TvDatafeed()
+
+    def get_hist(self, symbol: str, interval: str, n_bars: int, **kwargs) -> pd.DataFrame:
+        from tvDatafeed import Interval
+        return self.tv.get_hist(symbol=symbol, interval=Interval(interval), n_bars=n_bars, **kwargs)
 
 class TradingViewDataFeed:
-    def __init__(self, asset: str, interval: DataInterval, since: str = None):
+    def __init__(self, asset: str, interval: DataInterval, since: str = None, client=None):
         self.asset = asset
         self.interval = interval
-        self.tv = TvDatafeed()
+        # Anything with TvClient's get_hist, e.g. the record/replay clients in datafeed.replay
+        self.tv = client if client is not None else TvClient()
         self.since = since
         self.data = None
-        
+
     def get_data(self) -> pd.DataFrame:
         if(self.data is None):
             n_bars = (datetime.now() - datetime.strptime(self.since, "%Y-%m-%d")).days if self.since else 2000
             self.data = self.tv.get_hist(symbol=self.asset, interval=self.interval.value, n_bars=n_bars)
-        return self.data
\ No newline at end of file
+        return self.data
@@ -0,0 +1,175 @@
+"""
+Offline record/replay clients for TradingViewDataFeed.
+
+RecordingClient wraps a live TvClient and stores every response as a compressed
+fixture; ReplayClient serves those fixtures back without a network, with optional
+simulated latency, jitter and failures. Both expose TvClient's get_hist, so either
+can be passed as the `client` of a TradingViewDataFeed.
+
+tvDatafeed is only imported by TvClient, so the whole pipeline replays on machines
+where it is not installed.
+"""
+import os
+import re
+import gzip
+import time
+import pickle
+import random
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+# Default fixture directory, shared by recording and replaying runs
+FIXTURE_DIR = os.environ.get("MACRO_FEED_FIXTURES", os.path.join(".cache", "feed_fixtures"))
+
+FIXTURE_SUFFIX = ".pkl.gz"
+
+class ReplayMiss(LookupError):
+    """Raised when no fixture was recorded for a requested symbol and interval."""
+
+class InjectedFailure(ConnectionError):
+    """Simulated upstream failure raised by ReplayClient."""
+
+def _interval_name(interval: Any) -> str:
+    # Interval values ("1D", "1W", "1M"); enums such as DataInterval are reduced to them
+    return str(getattr(interval, "value", interval))
+
+def fixture_path(fixture_dir: str, symbol: str, interval: Any) -> str:
+    """
+    Returns the fixture file for a symbol and interval.
+
+    :param fixture_dir: Directory holding the fixtures.
+    :param symbol: Requested symbol (e.g. "INDEX:BTCUSD").
+    :param interval: Interval value (e.g. "1D") or an enum holding it.
+    :return: Path of the fixture file.
+    """
+    name = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{symbol}@{_interval_name(interval)}")
+    return os.path.join(fixture_dir, name + FIXTURE_SUFFIX)
+
+def save_fixture(path: str, symbol: str, interval: Any, data: pd.DataFrame) -> None:
+    """
+    Writes a recorded response atomically as a gzip-compressed pickle.
+
+    :param path: Destination file.
+    :param symbol: Requested symbol.
+    :param interval: Requested interval.
+    :param data: DataFrame returned by the feed.
+    """
+    record = {
+        "symbol": symbol,
+        "interval": _interval_name(interval),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "data": data,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".fixture-")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as file:
+            pickle.dump(record, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def load_fixture(path: str) -> Dict[str, Any]:
+    """
+    Reads a fixture written by save_fixture.
+
+    :param path: Fixture file.
+    :return: Dictionary with symbol, interval, recorded_at and data.
+    """
+    with gzip.open(path, "rb") as file:
+        return pickle.load(file)
+
+class RecordingClient:
+    """
+    Pass-through client that records every successful response as a fixture.
+
+    :param client: Live client, normally a datafeed.datafeed.TvClient.
+    :param fixture_dir: Directory the fixtures are written to.
+    """
+    def __init__(self, client: Any, fixture_dir: str = FIXTURE_DIR):
+        self.client = client
+        self.fixture_dir = fixture_dir
+        self.recorded: List[str] = []
+
+    def get_hist(self, symbol: str, exchange: str = None, interval: Any = None, n_bars: int = 10, **kwargs) -> Optional[pd.DataFrame]:
+        if exchange is not None:
+            kwargs["exchange"] = exchange
+        data = self.client.get_hist(symbol=symbol, interval=interval, n_bars=n_bars, **kwargs)
+        # TvDatafeed returns None when a request fails; there is nothing to record then
+        if data is not None:
+            path = fixture_path(self.fixture_dir, symbol, interval)
+            save_fixture(path, symbol, interval, data)
+            self.recorded.append(path)
+        return data
+
+class ReplayClient:
+    """
+    Serves recorded fixtures in place of TvClient, with simulated network behavior.
+
+    Every request waits `latency` seconds plus an exponentially distributed extra
+    delay with mean `jitter`, which gives the long right tail real fetches show, and
+    then fails with probability `failure_rate`. The random draws come from a seeded
+    generator, so a given seed replays the same delays and failures.
+
+    :param fixture_dir: Directory holding the fixtures.
+    :param latency: Fixed per-request delay in seconds.
+    :param jitter: Mean extra delay in seconds.
+    :param failure_rate: Probability in [0, 1] that a request raises InjectedFailure.
+    :param seed: Seed of the random generator; None for a non-reproducible run.
+    :param sleep: Function used to wait; replace it to simulate time without waiting.
+    """
+    def __init__(self, fixture_dir: str = FIXTURE_DIR, latency: float = 0.0, jitter: float = 0.0,
+                 failure_rate: float = 0.0, seed: Optional[int] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must be non-negative")
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError("failure_rate must be between 0 and 1")
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.sleep = sleep
+        self.requests = 0
+        self.failures = 0
+        self.delays: List[float] = []
+        self._rng = random.Random(seed)
+        self._fixtures: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def get_hist(self, symbol: str, exchange: str = None, interval: Any = None, n_bars: int = 10, **kwargs) -> pd.DataFrame:
+        """
+        Returns the last `n_bars` bars recorded for a symbol and interval.
+
+        :raises ReplayMiss: If no fixture was recorded for the request.
+        :raises InjectedFailure: When a failure is injected.
+        """
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._rng.expovariate(1.0 / self.jitter) if self.jitter else 0.0)
+            failed = self._rng.random() < self.failure_rate
+            self.delays.append(delay)
+            if failed:
+                self.failures += 1
+        if delay:
+            self.sleep(delay)
+        if failed:
+            raise InjectedFailure(f"Injected failure for {symbol} {_interval_name(interval)}")
+        return self._fixture(symbol, interval).tail(n_bars).copy()
+
+    def _fixture(self, symbol: str, interval: Any) -> pd.DataFrame:
+        path = fixture_path(self.fixture_dir, symbol, interval)
+        with self._lock:
+            data = self._fixtures.get(path)
+        if data is None:
+            if not os.path.exists(path):
+                raise ReplayMiss(f"No fixture recorded for {symbol} {_interval_name(interval)} in {self.fixture_dir}")
+            data = load_fixture(path)["data"]
+            with self._lock:
+                self._fixtures[path] = data
+        return data
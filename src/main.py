@@ -1,65 +1,156 @@
-from config.readConfig import read_config, MacroTicker
-from datafeed.datafeed import TradingViewDataFeed, DataInterval
-from data_processing.correlation import multi_timeframe_sliding_correlation 
+from config.readConfig import ConfigWatcher
+from pipeline import apply_config_diff, process_market_data
+from storage.snapshot import SNAPSHOT_PATH, Snapshot, SnapshotRefresher, load_snapshot, read_snapshot_info
+from storage.memory import SessionMemoryManager
 import streamlit as st
-from typing import List, Dict, Any
-import pandas as pd
+from typing import Dict, Any, Optional
+import os
+import uuid
+import threading
 
-def parse_interval(frequency: str):
+CONFIG_PATH = 'MacroTickers.yaml'
+
+# Set when the precompute worker publishes results; the dashboard then only reads them
+READ_ONLY = os.environ.get("MACRO_DASHBOARD_READ_ONLY") == "1"
+
+# Memory budget for market data held across all sessions
+MEMORY_BUDGET_BYTES = int(os.environ.get("MACRO_MEMORY_BUDGET_MB", "1024")) * 1024 * 1024
+
+# Sessions idle this long are dropped; closed tabs never tell the server they are gone
+MEMORY_IDLE_SECONDS = float(os.environ.get("MACRO_SESSION_IDLE_S", "3600"))
+MEMORY_MAX_SESSIONS = int(os.environ.get("MACRO_MAX_SESSIONS", "1000"))
+
+@st.cache_resource
+def get_config_watcher() -> ConfigWatcher:
+    """Config watcher shared by all sessions; the file is re-parsed only when it changes."""
+    return ConfigWatcher(CONFIG_PATH)
+
+@st.cache_resource
+def get_snapshot_refresher() -> SnapshotRefresher:
+    """Background refresher shared by all sessions; persists a snapshot after each run."""
+    watcher = get_config_watcher()
+    
+    def compute():
+        market_data = process_market_data(*watcher.current())
+        return market_data, market_data["config_hash"]
+    
+    return SnapshotRefresher(SNAPSHOT_PATH, compute)
+
+@st.cache_resource
+def get_compute_lock() -> threading.Lock:
+    """Serializes foreground computes (cold start, config diffs) so one session does the work for all."""
+    return threading.Lock()
+
+@st.cache_resource
+def get_memory_manager() -> SessionMemoryManager:
+    """Memory manager shared by all sessions; owns their market data between reruns."""
+    return SessionMemoryManager(MEMORY_BUDGET_BYTES, idle_seconds=MEMORY_IDLE_SECONDS, max_sessions=MEMORY_MAX_SESSIONS)
+
+def latest_published(memory: SessionMemoryManager) -> Optional[Snapshot]:
     """
-    Parses the frequency string and returns the corresponding DataInterval enum value.
+    Returns the current persisted snapshot, loading it only once per version.
     
-    :param frequency: Frequency string (e.g., "D", "W", "M").
-    :return: DataInterval enum value.
+    :param memory: Shared memory manager holding the shared state.
+    :return: Snapshot, or None if nothing has been persisted yet.
     """
-    frequency_map = {
-        "D": DataInterval.ONE_DAY,
-        "W": DataInterval.ONE_WEEK,
-        "M": DataInterval.ONE_MONTH
-    }
-    return frequency_map[frequency] if frequency in frequency_map else None
+    info = read_snapshot_info(SNAPSHOT_PATH)
+    if info is None:
+        return None
+    shared = memory.shared(info.created_at)
+    if shared is not None:
+        return Snapshot(state=shared, info=info)
+    snapshot = load_snapshot(SNAPSHOT_PATH)
+    if snapshot is not None:
+        memory.share(snapshot.info.created_at, snapshot.state)
+    return snapshot
 
-def process_market_data() -> Dict[str, Any]:
-    """Process market data and calculate correlations"""
-    # Read configuration
-    config = read_config('MacroTickers.yaml')
-    
-    # Create TradingViewDataFeed instances for each ticker
-    data_feed = [TradingViewDataFeed(asset=ticker.symbol, interval=parse_interval(ticker.frequency), since="2017-12-31") for ticker in config]
-    raw_data = {}
-    for ticker, feed in zip(config, data_feed):
-        raw_data[ticker.symbol] = feed.get_data()
-    
-    # Fetch Bitcoin data to compare against
-    bitcoin_feed = TradingViewDataFeed(asset="INDEX:BTCUSD", interval=DataInterval.ONE_DAY, since="2017-12-31")
-    bitcoin_data = bitcoin_feed.get_data()
+def load_session_market_data(refresher: Optional[SnapshotRefresher], memory: SessionMemoryManager, session_key: str) -> Dict[str, Any]:
+    """
+    Loads the newest computed state available into a session.
     
-    # Calculate correlations
-    correlation_data = {}
-    timeframes = [15, 30, 60, 90]
+    The shared state is reused when it matches the newest snapshot; otherwise a
+    persisted snapshot is served immediately while a background refresh runs.
+    Only when no snapshot exists is the data fetched live before the first render,
+    once for all sessions opened while that fetch runs.
     
-    for ticker in config:
-        # Create a single-item dictionary for each asset to match the function's expected input
-        asset_dict = {ticker.symbol: raw_data[ticker.symbol]}
-        result = multi_timeframe_sliding_correlation(
-            asset_dict,  # Pass a dictionary with a single asset
-            bitcoin_data, 
-            timeframes
-        )
-        # The result is a dict with one entry, extract just the Series
-        correlation_data[ticker.symbol] = result[ticker.symbol]
+    :param refresher: Shared snapshot refresher, or None when the dashboard only reads.
+    :param memory: Shared memory manager.
+    :param session_key: Key of the current session.
+    :return: Market data dictionary.
+    """
+    snapshot = refresher.latest if refresher is not None else None
+    if snapshot is None:
+        snapshot = latest_published(memory)
+        if snapshot is None and refresher is None:
+            st.info("Waiting for the precompute worker to publish its first result.")
+            st.stop()
+        if snapshot is None:
+            with get_compute_lock():
+                # Another session may have completed the fetch while this one waited
+                snapshot = refresher.latest or latest_published(memory)
+                if snapshot is None:
+                    market_data = process_market_data(*get_config_watcher().current())
+                    snapshot = refresher.publish(market_data, market_data["config_hash"])
+        else:
+            refresher.start()
     
-    return {
-        "config": config,
-        "raw_data": raw_data,
-        "bitcoin_data": bitcoin_data,
-        "correlation_data": correlation_data
-    }
+    memory.share(snapshot.info.created_at, snapshot.state)
+    memory.put(session_key, snapshot.state, snapshot.info.created_at)
+    st.session_state.data_as_of = snapshot.info.created_at
+    return snapshot.state
 
 def main():
-    # Initialize session state if not already done
-    if 'market_data' not in st.session_state:
-        st.session_state.market_data = process_market_data()
+    memory = get_memory_manager()
+    session_key = st.session_state.setdefault("session_key", uuid.uuid4().hex)
+    
+    if READ_ONLY:
+        # The precompute worker publishes results; this process never fetches
+        refresher = None
+        latest = latest_published(memory)
+        if latest is None:
+            st.info("Waiting for the precompute worker to publish its first result.")
+            st.stop()
+    else:
+        refresher = get_snapshot_refresher()
+        latest = refresher.latest
+    if latest is not None:
+        memory.share(latest.info.created_at, latest.state)
+    
+    market_data = memory.get(session_key)
+    if market_data is None:
+        # New session, or its data was evicted under memory pressure
+        market_data = load_session_market_data(refresher, memory, session_key)
+    elif latest is not None and latest.info.created_at > st.session_state.data_as_of:
+        # A newer result was computed since this session loaded; swap it in
+        market_data = latest.state
+        memory.put(session_key, market_data, latest.info.created_at)
+        st.session_state.data_as_of = latest.info.created_at
+    
+    # Pick up edits to the config without a restart, recomputing only what changed.
+    # The result becomes the latest snapshot, so other sessions reuse it.
+    if refresher is not None:
+        config, digest = get_config_watcher().current()
+        if digest != market_data["config_hash"]:
+            with get_compute_lock():
+                latest = refresher.latest
+                if latest is None or latest.info.config_hash != digest:
+                    latest = refresher.publish(apply_config_diff(market_data, config, digest), digest)
+            memory.share(latest.info.created_at, latest.state)
+            market_data = latest.state
+            memory.put(session_key, market_data, latest.info.created_at)
+            st.session_state.data_as_of = latest.info.created_at
+    
+    status = f"Data as of {st.session_state.data_as_of:%Y-%m-%d %H:%M} UTC"
+    if refresher is not None and refresher.running:
+        status += " (refreshing)"
+    st.sidebar.caption(status)
+    if refresher is not None and refresher.error is not None:
+        st.sidebar.warning(f"Background refresh failed: {refresher.error}")
+    if get_config_watcher().error is not None:
+        st.sidebar.warning(f"{CONFIG_PATH} could not be read; serving the last valid config: {get_config_watcher().error}")
+    with st.sidebar.expander("Memory"):
+        # Totals only; a row per session would grow with every visitor
+        st.json(memory.metrics())
     
     indicator_options = {
         "Quant Research": [
@@ -67,8 +158,14 @@ def main():
         ]
     }
     
-    pg = st.navigation(indicator_options)
-    pg.run()
+    # Views read market data from session state during this run only; between
+    # reruns the memory manager owns it so idle sessions can be evicted
+    st.session_state.market_data = market_data
+    try:
+        pg = st.navigation(indicator_options)
+        pg.run()
+    finally:
+        del st.session_state["market_data"]
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,175 @@
+"""
+Market data pipeline: fetch, clean and compute correlation products.
+
+Shared by the Streamlit entry point and the background precompute worker.
+"""
+from config.readConfig import MacroTicker, diff_config
+from datafeed.datafeed import TradingViewDataFeed, DataInterval
+from data_processing.correlation import build_moment_indexes, window_correlations
+from data_processing.quality import QualityReport, clean_price_dataframe
+from typing import List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
+import pandas as pd
+import time
+
+# History start used unless a ticker or its group sets a "since" option
+DEFAULT_SINCE = "2017-12-31"
+
+# Correlation windows shown until the user picks their own
+DEFAULT_TIMEFRAMES = [15, 30, 60, 90]
+
+class StageTimer:
+    """
+    Accumulates wall-clock time per named pipeline stage.
+    """
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Times the enclosed block and adds it to the stage's total.
+
+        :param name: Stage name (e.g. "fetch").
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+def parse_interval(frequency: str):
+    """
+    Parses the frequency string and returns the corresponding DataInterval enum value.
+    
+    :param frequency: Frequency string (e.g., "D", "W", "M").
+    :return: DataInterval enum value.
+    """
+    frequency_map = {
+        "D": DataInterval.ONE_DAY,
+        "W": DataInterval.ONE_WEEK,
+        "M": DataInterval.ONE_MONTH
+    }
+    return frequency_map[frequency] if frequency in frequency_map else None
+
+def fetch_ticker_data(ticker: MacroTicker, client: Any = None) -> Tuple[pd.DataFrame, QualityReport]:
+    """
+    Fetches and cleans the price history of a single ticker.
+    
+    :param ticker: MacroTicker to fetch; its "since" option overrides DEFAULT_SINCE.
+    :param client: Optional TvClient-compatible client (e.g. a ReplayClient); defaults to a live TvClient.
+    :return: Tuple of the cleaned price DataFrame and its ingest QualityReport.
+    """
+    feed = TradingViewDataFeed(
+        asset=ticker.symbol,
+        interval=parse_interval(ticker.frequency),
+        since=ticker.options.get("since", DEFAULT_SINCE),
+        client=client
+    )
+    # Validate and clean once at ingest; downstream steps trust the recorded price column
+    return clean_price_dataframe(feed.get_data(), ticker.symbol)
+
+def apply_config_diff(
+    market_data: Dict[str, Any],
+    config: List[MacroTicker],
+    digest: str,
+    timer: Optional[StageTimer] = None,
+    client: Any = None
+) -> Dict[str, Any]:
+    """
+    Brings market data in line with a new config, touching only what changed.
+    
+    Added and changed tickers are fetched and their correlations computed, removed
+    tickers are evicted, and everything else is left as is.
+    
+    :param market_data: Market data previously returned by process_market_data.
+    :param config: New list of MacroTicker objects.
+    :param digest: Content hash of the new config.
+    :param timer: Optional StageTimer receiving "fetch" and "compute" timings.
+    :param client: Optional TvClient-compatible client passed to fetch_ticker_data.
+    :return: New market data dictionary; the input is left unchanged.
+    """
+    timer = timer or StageTimer()
+    diff = diff_config(market_data["config"], config)
+    bitcoin_data = market_data["bitcoin_data"]
+    
+    # Copy the containers so a state shared with other sessions is never mutated
+    raw_data = dict(market_data["raw_data"])
+    moment_index = dict(market_data["moment_index"])
+    correlation_data = dict(market_data["correlation_data"])
+    quality = dict(market_data["quality"])
+    
+    for ticker in diff.removed:
+        for container in (raw_data, moment_index, correlation_data, quality):
+            container.pop(ticker.symbol, None)
+    
+    with timer.stage("fetch"):
+        fetched = {ticker.symbol: fetch_ticker_data(ticker, client=client) for ticker in diff.added + diff.changed}
+    refreshed = {symbol: data for symbol, (data, _) in fetched.items()}
+    raw_data.update(refreshed)
+    quality.update({symbol: report for symbol, (_, report) in fetched.items()})
+    
+    # Build the prefix-sum moment index once per data version; any window is then O(1)
+    with timer.stage("compute"):
+        refreshed_index = build_moment_indexes(refreshed, bitcoin_data)
+        moment_index.update(refreshed_index)
+        correlation_data.update(window_correlations(refreshed_index, market_data["timeframes"]))
+    
+    return {
+        **market_data,
+        "config": config,
+        "config_hash": digest,
+        "raw_data": raw_data,
+        "moment_index": moment_index,
+        "correlation_data": correlation_data,
+        "quality": quality
+    }
+
+def process_market_data(
+    config: List[MacroTicker],
+    digest: str,
+    timer: Optional[StageTimer] = None,
+    client: Any = None
+) -> Dict[str, Any]:
+    """
+    Process market data and calculate correlations
+    
+    :param config: List of MacroTicker objects to fetch.
+    :param digest: Content hash of the config.
+    :param timer: Optional StageTimer receiving "fetch" and "compute" timings.
+    :param client: Optional TvClient-compatible client passed to fetch_ticker_data.
+    :return: Market data dictionary.
+    """
+    timer = timer or StageTimer()
+    
+    # Fetch Bitcoin data to compare against
+    with timer.stage("fetch"):
+        bitcoin_data, bitcoin_quality = fetch_ticker_data(MacroTicker(symbol="INDEX:BTCUSD", frequency="D"), client=client)
+    
+    # Start from an empty universe so every configured ticker is treated as added
+    market_data = {
+        "config": [],
+        "config_hash": None,
+        "raw_data": {},
+        "bitcoin_data": bitcoin_data,
+        "moment_index": {},
+        "timeframes": DEFAULT_TIMEFRAMES,
+        "correlation_data": {},
+        "quality": {},
+        "bitcoin_quality": bitcoin_quality
+    }
+    return apply_config_diff(market_data, config, digest, timer, client)
+
+def data_freshness(market_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reports the timestamp of the latest bar of every series.
+    
+    :param market_data: Market data dictionary.
+    :return: Dictionary with the latest bar per symbol and the oldest of those.
+    """
+    frames = {"INDEX:BTCUSD": market_data["bitcoin_data"], **market_data["raw_data"]}
+    last_bars = {symbol: frame.index.max() for symbol, frame in frames.items() if len(frame)}
+    return {
+        "last_bar": {symbol: timestamp.isoformat() for symbol, timestamp in last_bars.items()},
+        "stalest_bar": min(last_bars.values()).isoformat() if last_bars else None,
+    }
@@ -0,0 +1,130 @@
+"""
+Startup-time profiler for the Streamlit entry point.
+
+Imports a module in a fresh interpreter with ``-X importtime`` and reports the
+import and initialization time of every module it pulls in. Run from the project
+root:
+
+    python src/startup_profile.py --output .cache/startup_profile.json --budget 3
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+from dataclasses import dataclass, asdict
+from typing import List, Optional
+
+@dataclass
+class ImportRecord:
+    """
+    Data class representing one line of ``-X importtime`` output.
+
+    :param module: Fully qualified module name.
+    :param self_us: Time spent importing and initializing the module itself, in microseconds.
+    :param cumulative_us: Time including the modules it imported, in microseconds.
+    :param depth: Nesting level in the import tree (0 for top-level imports).
+    """
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parses the stderr of an interpreter run with ``-X importtime``.
+
+    :param output: Captured stderr.
+    :return: List of ImportRecord objects in the order they were reported.
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        name = fields[2].rstrip()
+        stripped = name.lstrip(" ")
+        records.append(ImportRecord(
+            module=stripped,
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+            depth=(len(name) - len(stripped) - 1) // 2
+        ))
+    return records
+
+def profile_imports(module: str, path: str, python: str = sys.executable) -> List[ImportRecord]:
+    """
+    Imports a module in a fresh interpreter and records per-module import times.
+
+    :param module: Module to import (e.g. "main").
+    :param path: Directory the module is imported from, used as working directory and sys.path entry.
+    :param python: Interpreter to run.
+    :return: List of ImportRecord objects.
+    :raises RuntimeError: If the import fails.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [path, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=path, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+def total_import_seconds(records: List[ImportRecord], module: str) -> float:
+    """
+    Returns the cumulative import time of a module.
+
+    :param records: Output of profile_imports.
+    :param module: Module whose cumulative time to return.
+    :return: Cumulative time in seconds, or 0.0 if the module was not imported.
+    """
+    for record in records:
+        if record.module == module:
+            return record.cumulative_us / 1e6
+    return 0.0
+
+def write_report(path: str, module: str, records: List[ImportRecord], top: int = 25) -> dict:
+    """
+    Writes a JSON report of the slowest modules to a file.
+
+    :param path: Report destination.
+    :param module: Profiled module.
+    :param records: Output of profile_imports.
+    :param top: Number of slowest modules (by self time) to include.
+    :return: The report as a dictionary.
+    """
+    report = {
+        "module": module,
+        "total_seconds": total_import_seconds(records, module),
+        "modules_imported": len(records),
+        "slowest": [asdict(record) for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]],
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+    return report
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="module to profile (default: main)")
+    parser.add_argument("--output", default=os.path.join(".cache", "startup_profile.json"), help="report path")
+    parser.add_argument("--budget", type=float, default=None, help="fail if the cold import takes longer (seconds)")
+    args = parser.parse_args(argv)
+
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    records = profile_imports(args.module, src_dir)
+    report = write_report(args.output, args.module, records)
+
+    print(f"{args.module}: {report['total_seconds']:.3f}s cold import, {report['modules_imported']} modules")
+    for record in report["slowest"][:10]:
+        print(f"  {record['self_us'] / 1000:8.1f} ms  {record['module']}")
+    if args.budget is not None and report["total_seconds"] > args.budget:
+        print(f"Cold import exceeds budget of {args.budget:.3f}s", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
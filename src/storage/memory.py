@@ -0,0 +1,225 @@
+import sys
+import time
+import threading
+import dataclasses
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+def estimate_bytes(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """Estimate the bytes held by a payload, counting each object once.
+
+    Parameters:
+        obj: Payload to measure (DataFrames, Series, arrays, dataclasses and containers)
+        seen: Ids of objects already accounted for elsewhere; updated in place
+
+    Returns:
+        Estimated size in bytes of everything reachable from `obj` not in `seen`
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_bytes(value, seen) for value in obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_bytes(item, seen) for item in obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return sys.getsizeof(obj) + sum(estimate_bytes(getattr(obj, f.name), seen) for f in dataclasses.fields(obj))
+    return sys.getsizeof(obj)
+
+@dataclass
+class _SessionEntry:
+    payload: Any
+    version: Optional[Hashable]
+    bytes: int
+    datasets: Dict[str, int] = field(default_factory=dict)
+    last_access: float = 0.0
+
+class SessionMemoryManager:
+    """Memory-bounded owner of per-session payloads with LRU eviction.
+
+    Each payload is accounted by the bytes it holds beyond the shared payload, so
+    sessions pointing at the shared state cost nothing. When the total exceeds the
+    budget, least-recently-used sessions are first downgraded to the shared payload
+    (if they hold a private copy of the same version) and then evicted outright.
+    An evicted session gets None from `get` and is expected to reload.
+
+    Sessions are also dropped, whatever they hold, once unused for `idle_seconds`
+    or when more than `max_sessions` are tracked, so closed browser tabs do not
+    accumulate entries.
+
+    Parameters:
+        budget_bytes: Upper bound on shared plus per-session resident bytes
+        idle_seconds: Sessions not accessed for this long are removed; None keeps them
+        max_sessions: Most sessions tracked at once, least recently used dropped first; None for no cap
+        clock: Monotonic time source, replaceable in tests
+    """
+    def __init__(self, budget_bytes: int, idle_seconds: Optional[float] = None,
+                 max_sessions: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self.budget_bytes = budget_bytes
+        self.idle_seconds = idle_seconds
+        self.max_sessions = max_sessions
+        self._clock = clock
+        self._sessions: "OrderedDict[Hashable, _SessionEntry]" = OrderedDict()
+        self._shared: Any = None
+        self._shared_version: Optional[Hashable] = None
+        self._shared_ids: Set[int] = set()
+        self._shared_bytes = 0
+        self._evicted_bytes = 0
+        self._evictions = 0
+        self._downgrades = 0
+        self._expired = 0
+        self._lock = threading.RLock()
+
+    def share(self, version: Hashable, payload: Any) -> None:
+        """Register the payload every up-to-date session can reference."""
+        with self._lock:
+            if version == self._shared_version:
+                return
+            previous = self._shared
+            self._shared = payload
+            self._shared_version = version
+            self._shared_ids = set()
+            self._shared_bytes = estimate_bytes(payload, self._shared_ids)
+
+            # Sessions still on the previous shared payload now hold it privately
+            for entry in self._sessions.values():
+                if previous is not None and entry.payload is previous:
+                    refreshed = self._account(entry.payload, entry.version)
+                    entry.bytes, entry.datasets = refreshed.bytes, refreshed.datasets
+            self._enforce_budget()
+
+    def shared(self, version: Hashable) -> Any:
+        """Return the shared payload if it is at `version`, else None."""
+        with self._lock:
+            return self._shared if version == self._shared_version else None
+
+    def put(self, session_id: Hashable, payload: Any, version: Optional[Hashable] = None) -> None:
+        """Store a session's payload and mark it most recently used.
+
+        Parameters:
+            session_id: Identifier of the session
+            payload: Market data dictionary (or any payload) held for the session
+            version: Data version of the payload; None for session-specific state
+        """
+        with self._lock:
+            entry = self._account(payload, version)
+            entry.last_access = self._clock()
+            self._sessions[session_id] = entry
+            self._sessions.move_to_end(session_id)
+            self._expire_sessions(protect=session_id)
+            self._enforce_budget(protect=session_id)
+
+    def get(self, session_id: Hashable) -> Any:
+        """Return a session's payload and mark it most recently used, or None if evicted."""
+        with self._lock:
+            self._expire_sessions(protect=session_id)
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            entry.last_access = self._clock()
+            self._sessions.move_to_end(session_id)
+            return entry.payload
+
+    def remove(self, session_id: Hashable) -> None:
+        """Drop a session's payload, e.g. when the session is known to be closed."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def version(self, session_id: Hashable) -> Optional[Hashable]:
+        """Return the data version a session's payload was stored with."""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            return entry.version if entry is not None else None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Totals over all sessions: resident, shared and evicted bytes and session counts."""
+        with self._lock:
+            self._expire_sessions()
+            session_bytes = sum(entry.bytes for entry in self._sessions.values())
+            return {
+                "budget_bytes": self.budget_bytes,
+                "resident_bytes": self._shared_bytes + session_bytes,
+                "shared_bytes": self._shared_bytes,
+                "session_bytes": session_bytes,
+                "sessions": len(self._sessions),
+                "private_sessions": sum(1 for entry in self._sessions.values() if entry.bytes),
+                "evicted_bytes": self._evicted_bytes,
+                "evictions": self._evictions,
+                "downgrades": self._downgrades,
+                "expired_sessions": self._expired,
+            }
+
+    def session_metrics(self, session_id: Hashable) -> Optional[Dict[str, Any]]:
+        """Bytes held by one session, in total and per dataset; None if it is not tracked."""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            return {"bytes": entry.bytes, "datasets": dict(entry.datasets)}
+
+    def _account(self, payload: Any, version: Optional[Hashable]) -> _SessionEntry:
+        if payload is self._shared:
+            return _SessionEntry(payload=payload, version=version, bytes=0)
+
+        # Anything reachable from the shared payload is already paid for
+        seen = set(self._shared_ids)
+        if isinstance(payload, dict):
+            datasets = {str(key): estimate_bytes(value, seen) for key, value in payload.items()}
+            return _SessionEntry(payload=payload, version=version, bytes=sum(datasets.values()), datasets=datasets)
+        return _SessionEntry(payload=payload, version=version, bytes=estimate_bytes(payload, seen))
+
+    def _resident_bytes(self) -> int:
+        return self._shared_bytes + sum(entry.bytes for entry in self._sessions.values())
+
+    def _expire_sessions(self, protect: Optional[Hashable] = None) -> None:
+        # Entries are kept in access order, so idle ones are at the front
+        if self.idle_seconds is not None:
+            cutoff = self._clock() - self.idle_seconds
+            for session_id in list(self._sessions):
+                if self._sessions[session_id].last_access > cutoff:
+                    break
+                if session_id != protect:
+                    del self._sessions[session_id]
+                    self._expired += 1
+        if self.max_sessions is not None:
+            for session_id in list(self._sessions):
+                if len(self._sessions) <= self.max_sessions:
+                    break
+                if session_id != protect:
+                    del self._sessions[session_id]
+                    self._expired += 1
+
+    def _enforce_budget(self, protect: Optional[Hashable] = None) -> None:
+        if self._resident_bytes() <= self.budget_bytes:
+            return
+
+        # Cheapest first: private copies of the shared version become references to it
+        for entry in self._sessions.values():
+            if entry.bytes and self._shared_version is not None and entry.version == self._shared_version:
+                entry.payload = self._shared
+                entry.bytes = 0
+                entry.datasets = {}
+                self._downgrades += 1
+                if self._resident_bytes() <= self.budget_bytes:
+                    return
+
+        for session_id in list(self._sessions):
+            entry = self._sessions[session_id]
+            if session_id == protect or not entry.bytes:
+                continue
+            del self._sessions[session_id]
+            self._evicted_bytes += entry.bytes
+            self._evictions += 1
+            if self._resident_bytes() <= self.budget_bytes:
+                return
@@ -0,0 +1,111 @@
+import os
+import json
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from .snapshot import SNAPSHOT_PATH, SnapshotInfo, save_snapshot
+
+@dataclass
+class PublishedResult:
+    """A result set published to the store.
+
+    Attributes:
+        version: Version name, sortable by publication time
+        path: Versioned snapshot file
+        info: Snapshot header metadata
+    """
+    version: str
+    path: str
+    info: SnapshotInfo
+
+def _write_json_atomic(path: str, payload: Dict[str, Any]) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".run-")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(payload, file, indent=2, default=str)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+class ResultStore:
+    """Local store of versioned result sets with an atomically switched current version.
+
+    Each published state is written as its own snapshot under `history_dir`, next
+    to a JSON file with the run's metrics. Publishing then swaps `current_path`
+    (the snapshot the dashboard and the API read) to the new version with a
+    rename, so readers see either the previous or the new result set, never a mix.
+
+    Parameters:
+        current_path: Snapshot path readers load
+        history_dir: Directory for versioned snapshots; defaults to "versions" next to current_path
+        keep: Number of versions to retain
+    """
+    def __init__(self, current_path: str = SNAPSHOT_PATH, history_dir: Optional[str] = None, keep: int = 5):
+        self.current_path = current_path
+        self.history_dir = history_dir or os.path.join(os.path.dirname(os.path.abspath(current_path)), "versions")
+        self.keep = keep
+
+    @property
+    def run_path(self) -> str:
+        """JSON metrics of the run that produced the current version."""
+        return os.path.splitext(self.current_path)[0] + ".run.json"
+
+    def publish(self, state: Any, config_hash: Optional[str], run: Optional[Dict[str, Any]] = None) -> PublishedResult:
+        """Write a new version and make it current.
+
+        Parameters:
+            state: Computed market data
+            config_hash: Content hash of the config the state was computed from
+            run: Run metrics (durations, stage timings, freshness) stored alongside
+
+        Returns:
+            PublishedResult describing the new current version
+        """
+        os.makedirs(self.history_dir, exist_ok=True)
+        staging = os.path.join(self.history_dir, ".staging.snap")
+        info = save_snapshot(staging, state, config_hash)
+        version = info.created_at.strftime("%Y%m%dT%H%M%S%fZ") + (f"-{config_hash[:8]}" if config_hash else "")
+        path = os.path.join(self.history_dir, version + ".snap")
+        os.replace(staging, path)
+
+        run = {**(run or {}), "version": version, "created_at": info.created_at.isoformat(), "config_hash": config_hash}
+        _write_json_atomic(os.path.join(self.history_dir, version + ".run.json"), run)
+
+        # Link (or copy where links are unsupported) next to the current file, then rename over it
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.current_path)), prefix=".snapshot-")
+        os.close(fd)
+        os.unlink(tmp_path)
+        try:
+            os.link(path, tmp_path)
+        except OSError:
+            shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, self.current_path)
+        _write_json_atomic(self.run_path, run)
+
+        self._prune()
+        return PublishedResult(version=version, path=path, info=info)
+
+    def versions(self) -> List[str]:
+        """Published versions, oldest first."""
+        if not os.path.isdir(self.history_dir):
+            return []
+        return sorted(name[:-len(".snap")] for name in os.listdir(self.history_dir)
+                      if name.endswith(".snap") and not name.startswith("."))
+
+    def current_run(self) -> Optional[Dict[str, Any]]:
+        """Run metrics of the current version, or None if nothing was published."""
+        try:
+            with open(self.run_path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _prune(self) -> None:
+        for version in self.versions()[:-self.keep]:
+            for suffix in (".snap", ".run.json"):
+                try:
+                    os.remove(os.path.join(self.history_dir, version + suffix))
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,214 @@
+import os
+import io
+import mmap
+import json
+import struct
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional, Tuple
+
+# Default location of the dashboard's snapshot, shared by every process that reads it
+SNAPSHOT_PATH = os.environ.get("MACRO_SNAPSHOT_PATH", os.path.join(".cache", "market_data.snap"))
+
+# File layout: MAGIC | format version (uint32) | header length (uint64) | JSON header,
+# then, from the next aligned offset, the pickle payload followed by its out-of-band
+# buffers. Buffers are aligned so arrays can be mapped straight from the file.
+MAGIC = b"MCDSNAP\0"
+FORMAT_VERSION = 1
+
+# Version of the pickled state itself (the market data keys and the classes in it).
+# Bump it whenever either changes incompatibly, so snapshots written by an older
+# release are treated as missing instead of failing to unpickle after a deploy.
+STATE_VERSION = 3
+_PREFIX = struct.Struct("<8sIQ")
+_ALIGNMENT = 64
+
+@dataclass
+class SnapshotInfo:
+    """Metadata stored in a snapshot header.
+
+    Attributes:
+        created_at: UTC time at which the state was computed
+        config_hash: Content hash of the ticker config the state was computed from
+        format_version: Version of the file layout
+        state_version: Version of the pickled state
+    """
+    created_at: datetime
+    config_hash: Optional[str]
+    format_version: int = FORMAT_VERSION
+    state_version: int = STATE_VERSION
+
+@dataclass
+class Snapshot:
+    """A computed dashboard state together with its metadata."""
+    state: Any
+    info: SnapshotInfo
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+def save_snapshot(path: str, state: Any, config_hash: Optional[str] = None) -> SnapshotInfo:
+    """Persist a computed state as a versioned binary snapshot.
+
+    The state is pickled with protocol 5 so large arrays are written out-of-band
+    and can be memory mapped on load. The file is written to a temporary name and
+    renamed into place, so readers never see a partial snapshot.
+
+    Parameters:
+        path: Destination file
+        state: Picklable state (e.g. the market data dictionary)
+        config_hash: Content hash of the config the state was computed from
+
+    Returns:
+        SnapshotInfo written to the header
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    payload = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    # Offsets are relative to the start of the data section
+    layout = [(0, len(payload))]
+    offset = len(payload)
+    for raw in raw_buffers:
+        offset = _align(offset)
+        layout.append((offset, raw.nbytes))
+        offset += raw.nbytes
+
+    info = SnapshotInfo(created_at=datetime.now(timezone.utc), config_hash=config_hash)
+    header = json.dumps({
+        "created_at": info.created_at.isoformat(),
+        "config_hash": config_hash,
+        "state_version": STATE_VERSION,
+        "layout": layout,
+    }).encode("utf-8")
+    data_start = _align(_PREFIX.size + len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+            file.write(header)
+            for (relative, _), chunk in zip(layout, [payload, *raw_buffers]):
+                file.seek(data_start + relative)
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return info
+
+def read_snapshot_info(path: str) -> Optional[SnapshotInfo]:
+    """Read only the header of a snapshot, or None if it is missing or incompatible."""
+    try:
+        with open(path, "rb") as file:
+            header = _read_header(file)
+    except (OSError, ValueError, KeyError):
+        return None
+    return header[0] if header else None
+
+def _read_header(file: io.BufferedIOBase) -> Optional[Tuple[SnapshotInfo, List[Tuple[int, int]], int]]:
+    prefix = file.read(_PREFIX.size)
+    if len(prefix) != _PREFIX.size:
+        return None
+    magic, version, header_length = _PREFIX.unpack(prefix)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    header = json.loads(file.read(header_length).decode("utf-8"))
+    if header.get("state_version") != STATE_VERSION:
+        return None
+    info = SnapshotInfo(
+        created_at=datetime.fromisoformat(header["created_at"]),
+        config_hash=header["config_hash"],
+        format_version=version,
+        state_version=header["state_version"]
+    )
+    return info, [tuple(entry) for entry in header["layout"]], _align(_PREFIX.size + header_length)
+
+def load_snapshot(path: str) -> Optional[Snapshot]:
+    """Load a snapshot by memory mapping it.
+
+    Out-of-band buffers are handed to pickle as views into the mapping, so arrays
+    are paged in lazily instead of being read and copied up front. The mapping is
+    copy-on-write: loaded arrays stay writable without touching the file.
+
+    Snapshots are trusted local files written by `save_snapshot`; never load one
+    from an untrusted source, as unpickling can execute code.
+
+    Parameters:
+        path: Snapshot file
+
+    Returns:
+        Snapshot, or None if the file is missing, written in another format or state
+        version, or cannot be unpickled (truncated, corrupt, or referring to classes
+        that no longer exist)
+    """
+    try:
+        with open(path, "rb") as file:
+            header = _read_header(file)
+            if header is None:
+                return None
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError, KeyError):
+        return None
+
+    info, layout, data_start = header
+    view = memoryview(mapping)
+    chunks = [view[data_start + offset:data_start + offset + length] for offset, length in layout]
+    try:
+        state = pickle.loads(chunks[0], buffers=chunks[1:])
+    except Exception:
+        return None
+    return Snapshot(state=state, info=info)
+
+class SnapshotRefresher:
+    """Recompute a state in a background thread and persist it as a snapshot.
+
+    Parameters:
+        path: Snapshot file to write after each successful run
+        compute: Callable returning a (state, config_hash) tuple
+    """
+    def __init__(self, path: str, compute: Callable[[], Tuple[Any, Optional[str]]]):
+        self.path = path
+        self.compute = compute
+        self.latest: Optional[Snapshot] = None
+        self.error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Start a refresh unless one is already running; returns True if started."""
+        with self._lock:
+            if self.running:
+                return False
+            self._thread = threading.Thread(target=self._run, name="snapshot-refresh", daemon=True)
+            self._thread.start()
+            return True
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def publish(self, state: Any, config_hash: Optional[str]) -> Snapshot:
+        """Persist a state computed outside the refresher and make it the latest."""
+        info = save_snapshot(self.path, state, config_hash)
+        self.latest = Snapshot(state=state, info=info)
+        return self.latest
+
+    def _run(self) -> None:
+        try:
+            state, config_hash = self.compute()
+            self.publish(state, config_hash)
+            self.error = None
+        except Exception as e:
+            self.error = e
@@ -1,110 +1,17 @@
 import streamlit as st
 from streamlit_lightweight_charts import renderLightweightCharts
+from data_processing.correlation import window_statistics, STATISTICS
+from views.charts import create_multi_asset_chart, create_envelope_chart, create_correlation_chart, parse_windows
 import pandas as pd
 
-def create_price_chart(btc_series, asset_series, symbol):
-    """Create price comparison chart configuration"""
-    # Normalize both series
-    btc_norm = (btc_series - btc_series.min()) / (btc_series.max() - btc_series.min())
-    asset_norm = (asset_series - asset_series.min()) / (asset_series.max() - asset_series.min())
-    
-    btc_data = [{"time": str(idx.date()), "value": float(val)} 
-                for idx, val in btc_norm.items() if pd.notna(val)]
-    asset_data = [{"time": str(idx.date()), "value": float(val)} 
-                  for idx, val in asset_norm.items() if pd.notna(val)]
-    
-    return [
-        {
-            "name": "BTC",
-            "type": "line",
-            "data": btc_data,
-            "color": "orange",
-            "lineWidth": 2,
-        },
-        {
-            "name": symbol,
-            "type": "line",
-            "data": asset_data,
-            "color": "blue",
-            "lineWidth": 2,
-        }
-    ]
-
-def create_multi_asset_chart(btc_series, assets_dict):
-    """Create chart with Bitcoin in orange and all other assets in light gray"""
-    # Normalize BTC series
-    btc_norm = (btc_series - btc_series.min()) / (btc_series.max() - btc_series.min())
-    
-    btc_data = [{"time": str(idx.date()), "value": float(val)} 
-                for idx, val in btc_norm.items() if pd.notna(val)]
-    
-    # Start with BTC series
-    series_list = [{
-        "type": "Line",
-        "data": btc_data,
-        "options": {
-            "title": "Bitcoin",
-            "color": "orange",
-            "lineWidth": 2,
-            "priceScaleId": "right"
-        }
-    }]
-    
-    # Add all other assets in light gray
-    for symbol, asset_df in assets_dict.items():
-        if symbol == "INDEX:BTCUSD":
-            continue  # Skip Bitcoin as it's already added
-            
-        # Get close price column (handle different possible column names)
-        if 'close' in asset_df.columns:
-            price_col = 'close'
-        elif 'Close' in asset_df.columns:
-            price_col = 'Close'
-        else:
-            # Use first numeric column if standard names not found
-            numeric_cols = asset_df.select_dtypes(include=['float64', 'int64']).columns
-            if len(numeric_cols) > 0:
-                price_col = numeric_cols[0]
-            else:
-                continue  # Skip this asset if no suitable column found
-        
-        # Normalize asset series
-        asset_series = asset_df[price_col]
-        asset_norm = (asset_series - asset_series.min()) / (asset_series.max() - asset_series.min())
-        
-        asset_data = [{"time": str(idx.date()), "value": float(val)} 
-                      for idx, val in asset_norm.items() if pd.notna(val)]
-        
-        series_list.append({
-            "type": "Line",
-            "data": asset_data,
-            "options": {
-                "title": symbol,
-                "color": "lightgray",
-                "lineWidth": 1,
-                "priceScaleId": "right"
-            }
-        })
-    
-    return series_list
-
-def create_correlation_chart(correlations_dict):
-    """Create correlation comparison chart configuration"""
-    series_list = []
-    for symbol, series in correlations_dict.items():
-        data = [{"time": str(window), "value": float(val)} 
-                for window, val in series.items() if pd.notna(val)]
-        
-        series_list.append({
-            "type": "Line",
-            "data": data,
-            "options": {
-                "title": symbol,
-                "lineWidth": 2,
-                "priceScaleId": "right"
-            }
-        })
-    return series_list
+STATISTIC_LABELS = {
+    "correlation": "Correlation (price levels)",
+    "beta": "Beta to BTC (log returns)",
+    "covariance": "Covariance (log returns)",
+    "asset_volatility": "Volatility (std of log returns per bar)",
+    "btc_volatility": "BTC Volatility (std of log returns per bar)",
+    "volatility_ratio": "Volatility Ratio (asset / BTC)",
+}
 
 # Set the title of the app
 st.title("Macro Correlations Dashboard")
@@ -113,13 +20,26 @@ st.title("Macro Correlations Dashboard")
 market_data = st.session_state.market_data
 bitcoin_data = market_data["bitcoin_data"]
 raw_data = market_data["raw_data"]
-correlation_data = market_data["correlation_data"]
+moment_index = market_data["moment_index"]
+
+# Any window set and statistic is answered from the prefix-sum index without recomputing
+windows_text = st.text_input(
+    "Correlation windows (bars, comma-separated)",
+    value=", ".join(str(window) for window in market_data["timeframes"])
+)
+statistic = st.selectbox("Statistic", STATISTICS, format_func=STATISTIC_LABELS.get)
+try:
+    windows = parse_windows(windows_text)
+except ValueError as e:
+    st.error(f"Invalid windows: {e}")
+    windows = market_data["timeframes"]
+statistic_data = {symbol: table[statistic] for symbol, table in window_statistics(moment_index, windows).items()}
 
 # Create two columns for side-by-side charts
 col1, col2 = st.columns(2)
 
 with col1:
-    st.subheader("Asset Correlations with Bitcoin")
+    st.subheader(f"Asset {STATISTIC_LABELS[statistic]} against Bitcoin")
     # Display correlation chart on the left
     correlation_chart_options = {
         "layout": {
@@ -141,10 +61,14 @@ with col1:
         }
     }
     
+    if statistic != "correlation":
+        # Only correlation is bounded to [-1, 1]
+        correlation_chart_options["rightPriceScale"] = {"scaleMargins": {"top": 0.1, "bottom": 0.1}, "visible": True}
+    
     renderLightweightCharts([
         {
             "chart": correlation_chart_options,
-            "series": create_correlation_chart(correlation_data)
+            "series": create_correlation_chart(statistic_data)
         }
     ], 'correlation_chart')
 
@@ -169,16 +93,37 @@ with col2:
         }
     }
     
+    btc_prices = bitcoin_data['close'] if 'close' in bitcoin_data.columns else bitcoin_data.iloc[:, 0]
+    overlay_mode = st.radio(
+        "Overlay",
+        ["All assets", "Percentile envelope"],
+        index=0 if len(raw_data) <= 20 else 1,
+        horizontal=True
+    )
+    if overlay_mode == "Percentile envelope":
+        highlighted = st.multiselect(
+            "Highlight assets",
+            [symbol for symbol in raw_data if symbol != "INDEX:BTCUSD"]
+        )
+        price_series = create_envelope_chart(btc_prices, raw_data, highlighted)
+    else:
+        price_series = create_multi_asset_chart(btc_prices, raw_data)
+    
     renderLightweightCharts([
         {
             "chart": price_chart_options,
-            "series": create_multi_asset_chart(bitcoin_data['close'] if 'close' in bitcoin_data.columns else bitcoin_data.iloc[:, 0], raw_data)
+            "series": price_series
         }
     ], 'price_chart')
 
+# Quality findings recorded when the data was ingested
+reports = [market_data["bitcoin_quality"], *market_data["quality"].values()]
+with st.expander("Data quality"):
+    st.dataframe(pd.DataFrame([report.summary() for report in reports]))
+
 # Add explanation below the charts
 st.markdown("""
 ### Chart Explanation
-- **Left Chart:** Shows the correlation levels between Bitcoin and different assets across various timeframes
-- **Right Chart:** Displays normalized price movements of Bitcoin (orange) overlaid with all other assets (gray)
+- **Left Chart:** Shows the selected statistic (correlation of price levels by default, or beta, covariance and volatilities of log returns) between Bitcoin and different assets across various timeframes
+- **Right Chart:** Displays normalized price movements of Bitcoin (orange) overlaid with all other assets (gray), or with their p10/p25/median/p75/p90 envelope and any highlighted assets (blue)
 """)
\ No newline at end of file
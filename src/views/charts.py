@@ -0,0 +1,167 @@
+"""
+Chart payload builders shared by the dashboard views and the local API
+"""
+import pandas as pd
+from data_processing.envelope import normalized_universe, percentile_bands, DEFAULT_PERCENTILES
+
+def create_price_chart(btc_series, asset_series, symbol):
+    """Create price comparison chart configuration"""
+    # Normalize both series
+    btc_norm = (btc_series - btc_series.min()) / (btc_series.max() - btc_series.min())
+    asset_norm = (asset_series - asset_series.min()) / (asset_series.max() - asset_series.min())
+    
+    btc_data = [{"time": str(idx.date()), "value": float(val)} 
+                for idx, val in btc_norm.items() if pd.notna(val)]
+    asset_data = [{"time": str(idx.date()), "value": float(val)} 
+                  for idx, val in asset_norm.items() if pd.notna(val)]
+    
+    return [
+        {
+            "name": "BTC",
+            "type": "line",
+            "data": btc_data,
+            "color": "orange",
+            "lineWidth": 2,
+        },
+        {
+            "name": symbol,
+            "type": "line",
+            "data": asset_data,
+            "color": "blue",
+            "lineWidth": 2,
+        }
+    ]
+
+def create_multi_asset_chart(btc_series, assets_dict):
+    """Create chart with Bitcoin in orange and all other assets in light gray"""
+    # Normalize BTC series
+    btc_norm = (btc_series - btc_series.min()) / (btc_series.max() - btc_series.min())
+    
+    btc_data = [{"time": str(idx.date()), "value": float(val)} 
+                for idx, val in btc_norm.items() if pd.notna(val)]
+    
+    # Start with BTC series
+    series_list = [{
+        "type": "Line",
+        "data": btc_data,
+        "options": {
+            "title": "Bitcoin",
+            "color": "orange",
+            "lineWidth": 2,
+            "priceScaleId": "right"
+        }
+    }]
+    
+    # Add all other assets in light gray
+    for symbol, asset_df in assets_dict.items():
+        if symbol == "INDEX:BTCUSD":
+            continue  # Skip Bitcoin as it's already added
+            
+        # Get close price column (handle different possible column names)
+        if 'close' in asset_df.columns:
+            price_col = 'close'
+        elif 'Close' in asset_df.columns:
+            price_col = 'Close'
+        else:
+            # Use first numeric column if standard names not found
+            numeric_cols = asset_df.select_dtypes(include=['float64', 'int64']).columns
+            if len(numeric_cols) > 0:
+                price_col = numeric_cols[0]
+            else:
+                continue  # Skip this asset if no suitable column found
+        
+        # Normalize asset series
+        asset_series = asset_df[price_col]
+        asset_norm = (asset_series - asset_series.min()) / (asset_series.max() - asset_series.min())
+        
+        asset_data = [{"time": str(idx.date()), "value": float(val)} 
+                      for idx, val in asset_norm.items() if pd.notna(val)]
+        
+        series_list.append({
+            "type": "Line",
+            "data": asset_data,
+            "options": {
+                "title": symbol,
+                "color": "lightgray",
+                "lineWidth": 1,
+                "priceScaleId": "right"
+            }
+        })
+    
+    return series_list
+
+def create_envelope_chart(btc_series, assets_dict, highlighted=(), percentiles=None):
+    """Create chart with Bitcoin, percentile bands of all other assets, and highlighted assets"""
+    btc_norm = (btc_series - btc_series.min()) / (btc_series.max() - btc_series.min())
+    
+    series_list = [{
+        "type": "Line",
+        "data": [{"time": str(idx.date()), "value": float(val)}
+                 for idx, val in btc_norm.items() if pd.notna(val)],
+        "options": {
+            "title": "Bitcoin",
+            "color": "orange",
+            "lineWidth": 2,
+            "priceScaleId": "right"
+        }
+    }]
+    
+    # A handful of band series summarises the whole universe, however large
+    matrix = normalized_universe(assets_dict, exclude=["INDEX:BTCUSD"])
+    bands = percentile_bands(matrix, percentiles or DEFAULT_PERCENTILES)
+    for column in bands.columns:
+        is_median = column == "p50"
+        series_list.append({
+            "type": "Line",
+            "data": [{"time": str(idx.date()), "value": float(val)}
+                     for idx, val in bands[column].items() if pd.notna(val)],
+            "options": {
+                "title": column,
+                "color": "gray" if is_median else "lightgray",
+                "lineWidth": 2 if is_median else 1,
+                "lineStyle": 0 if is_median else 2,
+                "priceScaleId": "right"
+            }
+        })
+    
+    for symbol in highlighted:
+        if symbol not in matrix.columns:
+            continue
+        series_list.append({
+            "type": "Line",
+            "data": [{"time": str(idx.date()), "value": float(val)}
+                     for idx, val in matrix[symbol].items() if pd.notna(val)],
+            "options": {
+                "title": symbol,
+                "color": "blue",
+                "lineWidth": 2,
+                "priceScaleId": "right"
+            }
+        })
+    
+    return series_list
+
+def create_correlation_chart(correlations_dict):
+    """Create correlation comparison chart configuration"""
+    series_list = []
+    for symbol, series in correlations_dict.items():
+        data = [{"time": str(window), "value": float(val)} 
+                for window, val in series.items() if pd.notna(val)]
+        
+        series_list.append({
+            "type": "Line",
+            "data": data,
+            "options": {
+                "title": symbol,
+                "lineWidth": 2,
+                "priceScaleId": "right"
+            }
+        })
+    return series_list
+
+def parse_windows(text):
+    """Parse a comma-separated list of window lengths, e.g. "15, 30, 60"."""
+    windows = sorted({int(part) for part in text.replace(' ', '').split(',') if part})
+    if not windows or windows[0] < 2:
+        raise ValueError("Windows must be integers of at least 2")
+    return windows
@@ -0,0 +1,109 @@
+"""
+Scheduled background precompute worker.
+
+Fetches the universe from MacroTickers.yaml, computes every correlation product and
+publishes the result as a new version in the local result store, on a fixed
+schedule. With the worker running, start the dashboard with
+MACRO_DASHBOARD_READ_ONLY=1 so it only reads published results and never waits on
+the upstream feed. Run from the project root:
+
+    python src/worker.py --interval 900
+    python src/worker.py --once
+"""
+import sys
+import time
+import logging
+import argparse
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from config.readConfig import read_config, config_hash
+from pipeline import StageTimer, process_market_data, data_freshness
+from storage.result_store import ResultStore
+
+CONFIG_PATH = 'MacroTickers.yaml'
+
+# Seconds between the starts of two runs
+DEFAULT_INTERVAL = 15 * 60
+
+logger = logging.getLogger("worker")
+
+def run_once(store: ResultStore, config_path: str = CONFIG_PATH) -> Dict[str, Any]:
+    """
+    Runs the pipeline once and publishes the result.
+
+    :param store: ResultStore to publish to.
+    :param config_path: Path to the ticker config.
+    :return: Run metrics: duration, per-stage timings, data freshness and the published version.
+    """
+    started_at = datetime.now(timezone.utc)
+    start = time.perf_counter()
+    timer = StageTimer()
+
+    with timer.stage("read_config"):
+        config = read_config(config_path)
+        digest = config_hash(config)
+    market_data = process_market_data(config, digest, timer)
+
+    run = {
+        "started_at": started_at.isoformat(),
+        "tickers": len(config),
+        "freshness": data_freshness(market_data),
+    }
+    # Metrics stored with the version cover everything up to publishing itself
+    with timer.stage("publish"):
+        published = store.publish(market_data, digest, {
+            **run,
+            "stages": dict(timer.stages),
+            "duration_seconds": time.perf_counter() - start,
+        })
+
+    run.update({
+        "version": published.version,
+        "stages": dict(timer.stages),
+        "duration_seconds": time.perf_counter() - start,
+    })
+    return run
+
+def run_forever(store: ResultStore, interval: float, config_path: str = CONFIG_PATH) -> None:
+    """
+    Runs the pipeline every `interval` seconds, measured start to start.
+
+    A failed run is logged and the previously published version stays current.
+
+    :param store: ResultStore to publish to.
+    :param interval: Seconds between run starts.
+    :param config_path: Path to the ticker config.
+    """
+    while True:
+        next_run = time.monotonic() + interval
+        try:
+            run = run_once(store, config_path)
+            logger.info("Published %s in %.1fs (%s)", run["version"], run["duration_seconds"],
+                        ", ".join(f"{name} {seconds:.1f}s" for name, seconds in run["stages"].items()))
+        except Exception:
+            logger.exception("Precompute run failed; keeping the current version")
+        time.sleep(max(0.0, next_run - time.monotonic()))
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=CONFIG_PATH)
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between runs")
+    parser.add_argument("--once", action="store_true", help="run a single time and exit")
+    parser.add_argument("--keep", type=int, default=5, help="number of published versions to retain")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    store = ResultStore(keep=args.keep)
+    if args.once:
+        run = run_once(store, args.config)
+        logger.info("Published %s in %.1fs", run["version"], run["duration_seconds"])
+        return 0
+    try:
+        run_forever(store, args.interval, args.config)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import unittest
+import os
+import sys
+import gzip
+import json
+import tempfile
+import threading
+import http.client
+import importlib.util
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+# Add project root and src to Python path; the API server is a top-level script like main.py
+project_root = str(Path(__file__).parent.parent)
+for path in (project_root, os.path.join(project_root, "src")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from api_server import create_server, accepts_gzip, ComputedState, ARROW_TYPE
+from storage.snapshot import save_snapshot
+from data_processing.correlation import build_moment_indexes, window_correlations
+
+class TestApiServer(unittest.TestCase):
+    def setUp(self):
+        """Write a snapshot and start the API on a free port"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.temp_dir.name, "market_data.snap")
+        
+        dates = pd.date_range(start='2020-01-01', end='2020-12-31', freq='D')
+        rng = np.random.default_rng(3)
+        btc = pd.DataFrame({'close': 100 + np.cumsum(rng.normal(0, 1, len(dates)))}, index=dates)
+        raw_data = {
+            "INDEX:BTCUSD": btc,
+            "INDEX:ETHUSD": pd.DataFrame({'close': 50 + np.cumsum(rng.normal(0, 1, len(dates)))}, index=dates),
+        }
+        moment_index = build_moment_indexes(raw_data, btc)
+        save_snapshot(self.snapshot_path, {
+            "config": [],
+            "config_hash": "abc",
+            "raw_data": raw_data,
+            "bitcoin_data": btc,
+            "moment_index": moment_index,
+            "timeframes": [15, 30],
+            "correlation_data": window_correlations(moment_index, [15, 30]),
+        }, "abc")
+        
+        self.server = create_server("127.0.0.1", 0, self.snapshot_path)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+    
+    def tearDown(self):
+        """Stop the server and clean up temporary files"""
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+    
+    def request(self, path, headers=None):
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=10)
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        return response, body
+
+    def test_meta(self):
+        """Test the metadata endpoint"""
+        response, body = self.request("/api/v1/meta")
+        meta = json.loads(body)
+        
+        self.assertEqual(response.status, 200)
+        self.assertEqual(meta["config_hash"], "abc")
+        self.assertEqual(meta["symbols"], ["INDEX:BTCUSD", "INDEX:ETHUSD"])
+        self.assertEqual(meta["timeframes"], [15, 30])
+
+    def test_conditional_request(self):
+        """Test that a matching If-None-Match yields a bodiless 304"""
+        response, _ = self.request("/api/v1/correlations")
+        etag = response.getheader("ETag")
+        self.assertIsNotNone(etag)
+        
+        response, body = self.request("/api/v1/correlations", {"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+        
+        response, _ = self.request("/api/v1/correlations?windows=60", {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+
+    def test_etag_changes_with_snapshot(self):
+        """Test that a new snapshot invalidates previous validators"""
+        response, _ = self.request("/api/v1/meta")
+        etag = response.getheader("ETag")
+        save_snapshot(self.snapshot_path, {"raw_data": {}, "timeframes": [90]}, "def")
+        
+        response, body = self.request("/api/v1/meta", {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(body)["config_hash"], "def")
+
+    def test_correlations_with_windows(self):
+        """Test arbitrary windows answered from the moment index"""
+        response, body = self.request("/api/v1/correlations?windows=15,60")
+        correlations = json.loads(body)
+        
+        self.assertEqual(set(correlations["INDEX:ETHUSD"]), {"15", "60"})
+        self.assertAlmostEqual(correlations["INDEX:BTCUSD"]["60"], 1.0)
+        response, _ = self.request("/api/v1/correlations?windows=abc")
+        self.assertEqual(response.status, 400)
+
+    def test_other_statistics(self):
+        """Test statistics other than correlation"""
+        response, body = self.request("/api/v1/correlations?windows=30&statistic=beta")
+        betas = json.loads(body)
+        
+        self.assertEqual(response.status, 200)
+        self.assertAlmostEqual(betas["INDEX:BTCUSD"]["30"], 1.0)
+        self.assertEqual(self.request("/api/v1/correlations?statistic=alpha")[0].status, 400)
+
+    def test_series_gzip(self):
+        """Test gzip compression of large bodies"""
+        response, body = self.request("/api/v1/series/INDEX%3AETHUSD", {"Accept-Encoding": "gzip"})
+        
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        series = json.loads(gzip.decompress(body))
+        self.assertEqual(series["symbol"], "INDEX:ETHUSD")
+        self.assertEqual(series["columns"], ["close"])
+        self.assertEqual(len(series["data"]), 366)
+
+    def test_gzip_refused_by_q_value(self):
+        """Test that gzip;q=0 gets an uncompressed body"""
+        response, body = self.request("/api/v1/series/INDEX%3AETHUSD", {"Accept-Encoding": "gzip;q=0, identity"})
+        
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(json.loads(body)["symbol"], "INDEX:ETHUSD")
+
+    def test_accepts_gzip(self):
+        """Test Accept-Encoding parsing with q-values and wildcards"""
+        self.assertTrue(accepts_gzip("gzip"))
+        self.assertTrue(accepts_gzip("deflate, GZIP;q=0.5"))
+        self.assertTrue(accepts_gzip("br, *;q=0.1"))
+        self.assertFalse(accepts_gzip(""))
+        self.assertFalse(accepts_gzip("identity"))
+        self.assertFalse(accepts_gzip("gzip;q=0"))
+        self.assertFalse(accepts_gzip("gzip; q=0.000"))
+        self.assertFalse(accepts_gzip("*;q=0"))
+        self.assertFalse(accepts_gzip("gzip;q=0, *"))
+        self.assertFalse(accepts_gzip("gzip;q=bad"))
+
+    def test_unknown_resources(self):
+        """Test 404 responses"""
+        self.assertEqual(self.request("/api/v1/series/NOPE")[0].status, 404)
+        self.assertEqual(self.request("/api/v1/nothing")[0].status, 404)
+
+    def test_charts(self):
+        """Test chart payloads"""
+        response, body = self.request("/api/v1/charts/price?mode=envelope&highlight=INDEX:ETHUSD")
+        titles = [series["options"]["title"] for series in json.loads(body)]
+        
+        self.assertEqual(response.status, 200)
+        self.assertEqual(titles[0], "Bitcoin")
+        self.assertIn("p50", titles)
+        self.assertEqual(titles[-1], "INDEX:ETHUSD")
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_arrow_correlations(self):
+        """Test columnar responses for bulk consumers"""
+        import pyarrow as pa
+        response, body = self.request("/api/v1/correlations", {"Accept": ARROW_TYPE})
+        table = pa.ipc.open_stream(body).read_all()
+        
+        self.assertEqual(response.getheader("Content-Type"), ARROW_TYPE)
+        self.assertEqual(table.column_names, ["symbol", "window", "correlation"])
+        self.assertEqual(table.num_rows, 4)
+
+    def test_no_snapshot(self):
+        """Test that the API reports when nothing has been computed yet"""
+        os.remove(self.snapshot_path)
+        self.assertEqual(self.request("/api/v1/meta")[0].status, 503)
+
+    def test_internal_error(self):
+        """Test that unexpected failures still get a JSON 500 response"""
+        save_snapshot(self.snapshot_path, {"raw_data": {}, "timeframes": [15]}, "old")
+        with self.assertLogs("api_server", "ERROR"):
+            response, body = self.request("/api/v1/correlations?windows=15")
+        self.assertEqual(response.status, 500)
+        self.assertIn("error", json.loads(body))
+
+    def test_response_cache_is_bounded(self):
+        """Test that rendered responses are evicted least recently used first"""
+        state = ComputedState(self.snapshot_path, max_responses=2)
+        builds = []
+        def build(key):
+            builds.append(key)
+            return (key.encode("utf-8"), "text/plain")
+        
+        for key in ["a", "b", "a", "c", "a", "b"]:
+            state.response((key,), lambda: build(key))
+        self.assertEqual(builds, ["a", "b", "c", "b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,7 @@ project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from src.config.readConfig import read_config, MacroTicker
+from src.config.readConfig import read_config, MacroTicker, config_hash, diff_config, ConfigWatcher
 
 class TestConfigReader(unittest.TestCase):
     def setUp(self):
@@ -51,6 +51,24 @@ class TestConfigReader(unittest.TestCase):
         with open(self.incomplete_config_path, 'w') as f:
             yaml.dump(self.incomplete_yaml_data, f)
         
+        # Grouped YAML file with options
+        self.grouped_config_path = os.path.join(self.temp_dir.name, "grouped_config.yaml")
+        with open(self.grouped_config_path, 'w') as f:
+            f.write("""
+tickers:
+  - ticker: "INDEX:BTCUSD"
+    frequency: "D"
+groups:
+  equities:
+    since: "2015-01-01"
+    tickers:
+      - ticker: "SP:SPX"
+        frequency: "D"
+      - ticker: "NASDAQ:NDX"
+        frequency: "W"
+        since: "2019-01-01"
+""")
+        
         # Non-existent file path
         self.nonexistent_path = os.path.join(self.temp_dir.name, "nonexistent.yaml")
     
@@ -101,6 +119,44 @@ class TestConfigReader(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             read_config(self.nonexistent_path)
     
+    def test_read_duplicate_symbol(self):
+        """Test that a symbol configured at two frequencies is rejected"""
+        duplicate_path = os.path.join(self.temp_dir.name, "duplicate_config.yaml")
+        with open(duplicate_path, 'w') as f:
+            f.write("""
+tickers:
+  - ticker: "INDEX:ETHUSD"
+    frequency: "D"
+groups:
+  crypto:
+    tickers:
+      - ticker: "INDEX:ETHUSD"
+        frequency: "W"
+""")
+        with self.assertRaises(ValueError):
+            read_config(duplicate_path)
+    
+    def test_since_option(self):
+        """Test that quoted and unquoted since dates both become ISO strings"""
+        since_path = os.path.join(self.temp_dir.name, "since_config.yaml")
+        with open(since_path, 'w') as f:
+            f.write("""
+tickers:
+  - ticker: "A"
+    frequency: "D"
+    since: 2020-01-01
+  - ticker: "B"
+    frequency: "D"
+    since: "2019-06-30"
+""")
+        tickers = read_config(since_path)
+        self.assertEqual([t.options["since"] for t in tickers], ["2020-01-01", "2019-06-30"])
+        
+        with open(since_path, 'w') as f:
+            f.write('tickers:\n  - ticker: "A"\n    frequency: "D"\n    since: "last year"\n')
+        with self.assertRaises(ValueError):
+            read_config(since_path)
+    
     def test_macro_ticker_dataclass(self):
         """Test MacroTicker dataclass functionality"""
         ticker = MacroTicker(symbol="TEST:SYMBOL", frequency="D")
@@ -116,6 +172,88 @@ class TestConfigReader(unittest.TestCase):
         ticker3 = MacroTicker(symbol="OTHER:SYMBOL", frequency="D")
         self.assertNotEqual(ticker, ticker3)
 
+    def test_read_grouped_config(self):
+        """Test reading groups with inherited and overridden options"""
+        tickers = read_config(self.grouped_config_path)
+        
+        self.assertEqual([t.symbol for t in tickers], ["INDEX:BTCUSD", "SP:SPX", "NASDAQ:NDX"])
+        self.assertIsNone(tickers[0].group)
+        self.assertEqual(tickers[0].options, {})
+        self.assertEqual(tickers[1].group, "equities")
+        self.assertEqual(tickers[1].options, {"since": "2015-01-01"})
+        self.assertEqual(tickers[2].options, {"since": "2019-01-01"})
+        self.assertEqual(tickers[2].key, ("NASDAQ:NDX", "W"))
+    
+    def test_config_hash(self):
+        """Test that the hash tracks content, not formatting"""
+        tickers = read_config(self.valid_config_path)
+        with open(self.valid_config_path, 'a') as f:
+            f.write("# trailing comment\n")
+        
+        self.assertEqual(config_hash(tickers), config_hash(read_config(self.valid_config_path)))
+        tickers[0].options["since"] = "2020-01-01"
+        self.assertNotEqual(config_hash(tickers), config_hash(read_config(self.valid_config_path)))
+    
+    def test_diff_config(self):
+        """Test diffing two universes keyed by symbol and frequency"""
+        old = [
+            MacroTicker(symbol="A", frequency="D"),
+            MacroTicker(symbol="B", frequency="D"),
+            MacroTicker(symbol="C", frequency="W"),
+        ]
+        new = [
+            MacroTicker(symbol="A", frequency="D"),
+            MacroTicker(symbol="B", frequency="D", options={"since": "2020-01-01"}),
+            MacroTicker(symbol="C", frequency="M"),
+        ]
+        diff = diff_config(old, new)
+        
+        self.assertEqual([t.key for t in diff.unchanged], [("A", "D")])
+        self.assertEqual([t.key for t in diff.changed], [("B", "D")])
+        self.assertEqual([t.key for t in diff.added], [("C", "M")])
+        self.assertEqual([t.key for t in diff.removed], [("C", "W")])
+        self.assertFalse(diff.is_empty)
+        self.assertTrue(diff_config(new, new).is_empty)
+    
+    def test_config_watcher(self):
+        """Test that the watcher re-reads the file only after it changes"""
+        watcher = ConfigWatcher(self.valid_config_path)
+        tickers, digest = watcher.current()
+        self.assertEqual(len(tickers), 3)
+        self.assertIs(watcher.current()[0], tickers)
+        
+        with open(self.valid_config_path, 'w') as f:
+            yaml.dump({"tickers": self.valid_yaml_data["tickers"][:2]}, f)
+        os.utime(self.valid_config_path, ns=(0, 0))
+        tickers, new_digest = watcher.current()
+        self.assertEqual(len(tickers), 2)
+        self.assertNotEqual(digest, new_digest)
+
+    def test_config_watcher_keeps_last_valid_config(self):
+        """Test that a broken edit keeps the last valid universe and reports the error"""
+        watcher = ConfigWatcher(self.valid_config_path)
+        tickers, digest = watcher.current()
+        self.assertIsNone(watcher.error)
+        
+        for broken in ["tickers: [unclosed\n", 'tickers:\n  - ticker: "A"\n    frequency: "D"\n  - ticker: "A"\n    frequency: "W"\n']:
+            with open(self.valid_config_path, 'w') as f:
+                f.write(broken)
+            os.utime(self.valid_config_path, ns=(len(broken), len(broken)))
+            self.assertEqual(watcher.current(), (tickers, digest))
+            self.assertIsNotNone(watcher.error)
+        
+        with open(self.valid_config_path, 'w') as f:
+            yaml.dump({"tickers": self.valid_yaml_data["tickers"][:1]}, f)
+        os.utime(self.valid_config_path, ns=(0, 0))
+        self.assertEqual(len(watcher.current()[0]), 1)
+        self.assertIsNone(watcher.error)
+        
+        # Nothing valid to fall back to yet
+        with open(self.valid_config_path, 'w') as f:
+            f.write("tickers: [unclosed\n")
+        with self.assertRaises(yaml.YAMLError):
+            ConfigWatcher(self.valid_config_path).current()
+
 
 if __name__ == '__main__':
     unittest.main()
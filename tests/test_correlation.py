@@ -13,7 +13,12 @@ from src.data_processing.correlation import (
     normalize_series,
     calculate_average_correlation,
     multi_timeframe_sliding_correlation,
-    calculate_fixed_window_correlation
+    calculate_fixed_window_correlation,
+    build_moment_index,
+    build_moment_indexes,
+    window_correlations,
+    window_statistics,
+    STATISTICS
 )
 
 class TestCorrelation(unittest.TestCase):
@@ -212,6 +217,106 @@ class TestCorrelation(unittest.TestCase):
         # Should pick the first numeric column
         self.assertTrue((series3 == self.price_data_custom['price']).all())
 
+    def test_moment_index_matches_fixed_window(self):
+        """Test that prefix-sum window queries match the direct pandas computation"""
+        index = build_moment_index(self.price_data, self.btc_data)
+        for window in [2, 15, 30, 60, 90, 366, 1000]:
+            expected = calculate_fixed_window_correlation(self.price_data, self.btc_data, window)
+            # Prefix-sum differences carry float rounding, largest for the shortest windows
+            self.assertAlmostEqual(index.correlation(window), expected, places=7)
+
+    def test_moment_index_mixed_frequencies(self):
+        """Test window semantics when the asset is sampled less often than BTC"""
+        weekly = self.price_data.iloc[::7]
+        index = build_moment_index(weekly, self.btc_data)
+        for window in [15, 30, 52]:
+            expected = calculate_fixed_window_correlation(weekly, self.btc_data, window)
+            actual = index.correlation(window)
+            if np.isnan(expected):
+                self.assertTrue(np.isnan(actual))
+            else:
+                self.assertAlmostEqual(actual, expected, places=9)
+
+    def test_moment_index_date_range(self):
+        """Test date-range queries against a sliced pandas correlation"""
+        index = build_moment_index(self.price_data, self.btc_data)
+        start, end = '2020-03-01', '2020-06-30'
+        expected = self.price_data['close'][start:end].corr(self.btc_data['close'][start:end])
+        self.assertAlmostEqual(index.correlation_between(start, end), expected, places=9)
+        self.assertTrue(np.isnan(index.correlation_between('2020-03-01', '2020-03-01')))
+
+    def test_window_correlations(self):
+        """Test answering arbitrary windows for all assets from the indexes"""
+        windows = [15, 30, 60]
+        indexes = build_moment_indexes(self.assets_dict, self.btc_data)
+        result = window_correlations(indexes, windows)
+        expected = multi_timeframe_sliding_correlation(self.assets_dict, self.btc_data, windows)
+        
+        self.assertEqual(set(result.keys()), set(self.assets_dict.keys()))
+        for symbol, correlations in result.items():
+            self.assertIsInstance(correlations, pd.Series)
+            self.assertEqual(list(correlations.index), windows)
+            for window in windows:
+                self.assertAlmostEqual(correlations[window], expected[symbol][window], places=9)
+
+    def test_moment_index_statistics(self):
+        """Test beta, covariance and volatilities of log returns against pandas"""
+        index = build_moment_index(self.price_data, self.btc_data)
+        stats = index.statistics([30, 90])
+        self.assertEqual(list(stats.columns), STATISTICS)
+        
+        for window in [30, 90]:
+            prices = self.price_data['close'].iloc[-window:]
+            btc_prices = self.btc_data['close'].iloc[-window:]
+            self.assertAlmostEqual(stats.loc[window, 'correlation'], prices.corr(btc_prices), places=7)
+            
+            # A window of n prices holds n - 1 returns
+            asset = np.log(prices).diff().iloc[1:]
+            btc = np.log(btc_prices).diff().iloc[1:]
+            covariance = asset.cov(btc)
+            self.assertAlmostEqual(stats.loc[window, 'covariance'] / covariance, 1.0, places=7)
+            self.assertAlmostEqual(stats.loc[window, 'beta'] / (covariance / btc.var()), 1.0, places=7)
+            self.assertAlmostEqual(stats.loc[window, 'asset_volatility'] / asset.std(), 1.0, places=7)
+            self.assertAlmostEqual(stats.loc[window, 'btc_volatility'] / btc.std(), 1.0, places=7)
+            self.assertAlmostEqual(stats.loc[window, 'volatility_ratio'] / (asset.std() / btc.std()), 1.0, places=7)
+
+    def test_moment_index_statistics_degenerate(self):
+        """Test that undefined statistics are NaN rather than errors"""
+        flat_btc = self.btc_data.assign(close=1.0)
+        stats = build_moment_index(self.price_data, flat_btc).statistics([1, 30])
+        
+        self.assertTrue(stats.loc[1].isna().all())
+        self.assertTrue(np.isnan(stats.loc[30, 'beta']))
+        self.assertTrue(np.isnan(stats.loc[30, 'correlation']))
+        self.assertEqual(stats.loc[30, 'btc_volatility'], 0.0)
+        self.assertGreater(stats.loc[30, 'asset_volatility'], 0.0)
+
+    def test_moment_index_non_positive_prices(self):
+        """Test that returns touching a non-positive price are skipped, not propagated"""
+        prices = self.price_data.copy()
+        prices.iloc[-10, prices.columns.get_loc('close')] = -1.0
+        stats = build_moment_index(prices, self.btc_data).statistics([30])
+        
+        asset = np.log(prices['close'].iloc[-30:].where(lambda p: p > 0)).diff()
+        btc = np.log(self.btc_data['close'].iloc[-30:]).diff()
+        valid = asset.notna() & btc.notna()
+        self.assertEqual(valid.sum(), 27)
+        self.assertAlmostEqual(stats.loc[30, 'asset_volatility'] / asset[valid].std(), 1.0, places=7)
+        self.assertAlmostEqual(stats.loc[30, 'beta'] / (asset[valid].cov(btc[valid]) / btc[valid].var()), 1.0, places=7)
+
+    def test_window_statistics(self):
+        """Test statistics for all assets share the correlation results"""
+        indexes = build_moment_indexes(self.assets_dict, self.btc_data)
+        stats = window_statistics(indexes, [15, 60])
+        correlations = window_correlations(indexes, [15, 60])
+        
+        for symbol, table in stats.items():
+            self.assertEqual(list(table.index), [15, 60])
+            self.assertTrue(np.allclose(table['correlation'], correlations[symbol]))
+        # SPX is GOLD scaled by 1.5: same log returns, so the same beta and volatility
+        self.assertAlmostEqual(stats['SPX'].loc[60, 'beta'], stats['GOLD'].loc[60, 'beta'])
+        self.assertAlmostEqual(stats['SPX'].loc[60, 'asset_volatility'], stats['GOLD'].loc[60, 'asset_volatility'])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
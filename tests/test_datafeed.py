@@ -2,6 +2,7 @@ import unittest
 import sys
 import pandas as pd
 import numpy as np
+import importlib.util
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -13,6 +14,9 @@ if project_root not in sys.path:
 
 from src.datafeed.datafeed import TradingViewDataFeed, DataInterval
 
+HAS_TVDATAFEED = importlib.util.find_spec("tvDatafeed") is not None
+
+@unittest.skipUnless(HAS_TVDATAFEED, "tvDatafeed is not installed")
 class TestDatafeed(unittest.TestCase):
     
     def setUp(self):
@@ -27,7 +31,7 @@ class TestDatafeed(unittest.TestCase):
             'volume': np.random.randint(1000, 100000, len(dates))
         }, index=dates)
     
-    @patch('src.datafeed.datafeed.TvDatafeed')
+    @patch('tvDatafeed.TvDatafeed')
     def test_init(self, mock_tv_datafeed):
         """Test initialization of TradingViewDataFeed"""
         # Setup the mock
@@ -50,7 +54,7 @@ class TestDatafeed(unittest.TestCase):
         # Assert TvDatafeed was initialized
         mock_tv_datafeed.assert_called_once()
     
-    @patch('src.datafeed.datafeed.TvDatafeed')
+    @patch('tvDatafeed.TvDatafeed')
     def test_get_data_first_time(self, mock_tv_datafeed):
         """Test get_data method when called for the first time"""
         # Setup the mock
@@ -67,10 +71,11 @@ class TestDatafeed(unittest.TestCase):
         result = feed.get_data()
         
         # Assert get_hist was called with proper params
+        from tvDatafeed import Interval
         days_diff = (datetime.now() - datetime(2020, 1, 1)).days
         mock_instance.get_hist.assert_called_once_with(
             symbol="INDEX:BTCUSD",
-            interval=DataInterval.ONE_DAY.value,
+            interval=Interval.in_daily,
             n_bars=days_diff
         )
         
@@ -78,7 +83,7 @@ class TestDatafeed(unittest.TestCase):
         self.assertIs(result, self.mock_data)
         self.assertIs(feed.data, self.mock_data)
     
-    @patch('src.datafeed.datafeed.TvDatafeed')
+    @patch('tvDatafeed.TvDatafeed')
     def test_get_data_cached(self, mock_tv_datafeed):
         """Test get_data method when data is already cached"""
         # Setup the mock
@@ -101,7 +106,7 @@ class TestDatafeed(unittest.TestCase):
         # Assert result is the cached data
         self.assertIs(result, self.mock_data)
     
-    @patch('src.datafeed.datafeed.TvDatafeed')
+    @patch('tvDatafeed.TvDatafeed')
     def test_get_data_without_since(self, mock_tv_datafeed):
         """Test get_data method when since is not provided"""
         # Setup the mock
@@ -117,9 +122,10 @@ class TestDatafeed(unittest.TestCase):
         result = feed.get_data()
         
         # Assert get_hist was called with default n_bars
+        from tvDatafeed import Interval
         mock_instance.get_hist.assert_called_once_with(
             symbol="INDEX:BTCUSD",
-            interval=DataInterval.ONE_DAY.value,
+            interval=Interval.in_daily,
             n_bars=2000
         )
         
@@ -130,10 +136,22 @@ class TestDatafeed(unittest.TestCase):
         """Test DataInterval enum values"""
         from tvDatafeed import Interval
         
-        # Verify the enum values
-        self.assertEqual(DataInterval.ONE_DAY.value, Interval.in_daily)
-        self.assertEqual(DataInterval.ONE_WEEK.value, Interval.in_weekly)
-        self.assertEqual(DataInterval.ONE_MONTH.value, Interval.in_monthly)
+        # Verify the enum values map onto tvDatafeed's intervals
+        self.assertEqual(Interval(DataInterval.ONE_DAY.value), Interval.in_daily)
+        self.assertEqual(Interval(DataInterval.ONE_WEEK.value), Interval.in_weekly)
+        self.assertEqual(Interval(DataInterval.ONE_MONTH.value), Interval.in_monthly)
+
+class TestDatafeedClient(unittest.TestCase):
+    def test_custom_client(self):
+        """Test that an injected client is used as is, without tvDatafeed"""
+        client = Mock()
+        client.get_hist.return_value = pd.DataFrame({'close': [1.0, 2.0]})
+        
+        feed = TradingViewDataFeed(asset="INDEX:BTCUSD", interval=DataInterval.ONE_WEEK, client=client)
+        result = feed.get_data()
+        
+        client.get_hist.assert_called_once_with(symbol="INDEX:BTCUSD", interval="1W", n_bars=2000)
+        self.assertIs(result, client.get_hist.return_value)
         
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.data_processing.envelope import normalized_universe, percentile_bands
+
+class TestEnvelope(unittest.TestCase):
+    def setUp(self):
+        """Setup test data"""
+        dates = pd.date_range(start='2020-01-01', end='2020-03-31', freq='D')
+        rng = np.random.default_rng(7)
+        self.assets_dict = {
+            f"ASSET{i}": pd.DataFrame({'close': 100 + np.cumsum(rng.normal(0, 1, len(dates)))}, index=dates)
+            for i in range(50)
+        }
+        self.assets_dict["INDEX:BTCUSD"] = pd.DataFrame({'close': np.linspace(1, 2, len(dates))}, index=dates)
+        self.weekly = pd.DataFrame({'Close': np.arange(1.0, 14.0)}, index=dates[::7])
+
+    def test_normalized_universe(self):
+        """Test alignment, exclusion and per-asset normalization"""
+        matrix = normalized_universe(self.assets_dict, exclude=["INDEX:BTCUSD"])
+        
+        self.assertEqual(matrix.shape, (91, 50))
+        self.assertNotIn("INDEX:BTCUSD", matrix.columns)
+        np.testing.assert_allclose(matrix.min().to_numpy(), 0)
+        np.testing.assert_allclose(matrix.max().to_numpy(), 1)
+
+    def test_mixed_frequencies_carried_forward(self):
+        """Test that a weekly series is carried forward onto daily dates"""
+        matrix = normalized_universe({"DAILY": self.assets_dict["ASSET0"], "WEEKLY": self.weekly})
+        
+        self.assertEqual(len(matrix), 91)
+        self.assertEqual(matrix["WEEKLY"].iloc[3], matrix["WEEKLY"].iloc[0])
+
+    def test_percentile_bands(self):
+        """Test that bands match per-date percentiles and are ordered"""
+        matrix = normalized_universe(self.assets_dict)
+        bands = percentile_bands(matrix, [10, 50, 90])
+        
+        self.assertEqual(list(bands.columns), ["p10", "p50", "p90"])
+        self.assertEqual(len(bands), len(matrix))
+        self.assertAlmostEqual(bands["p50"].iloc[5], matrix.iloc[5].median())
+        self.assertTrue((bands["p10"] <= bands["p50"]).all())
+        self.assertTrue((bands["p50"] <= bands["p90"]).all())
+
+    def test_percentile_bands_skip_empty_dates(self):
+        """Test that dates where no asset has data are dropped"""
+        matrix = pd.DataFrame({'A': [np.nan, 0.5, 1.0], 'B': [np.nan, 0.0, np.nan]})
+        bands = percentile_bands(matrix, [50])
+        
+        self.assertEqual(list(bands.index), [1, 2])
+        self.assertEqual(list(bands["p50"]), [0.25, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.storage.memory import estimate_bytes, SessionMemoryManager
+
+class TestMemory(unittest.TestCase):
+    def setUp(self):
+        """Setup payloads of known size"""
+        self.frame_bytes = 100_000 * 8
+        
+    def make_payload(self):
+        frame = pd.DataFrame({'close': np.zeros(100_000)}, index=pd.RangeIndex(100_000))
+        return {"raw_data": {"GOLD": frame}, "timeframes": [15, 30]}
+
+    def test_estimate_bytes_counts_shared_objects_once(self):
+        """Test that objects reachable twice are only counted once"""
+        payload = self.make_payload()
+        single = estimate_bytes(payload)
+        payload["alias"] = payload["raw_data"]
+        
+        self.assertGreaterEqual(single, self.frame_bytes)
+        self.assertLess(estimate_bytes(payload) - single, 1000)
+        self.assertEqual(estimate_bytes(payload, seen={id(payload)}), 0)
+
+    def test_shared_references_cost_nothing(self):
+        """Test that sessions pointing at the shared payload hold no bytes"""
+        manager = SessionMemoryManager(budget_bytes=10 * self.frame_bytes)
+        shared = self.make_payload()
+        manager.share("v1", shared)
+        for session in range(20):
+            manager.put(session, shared, "v1")
+        
+        metrics = manager.metrics()
+        self.assertEqual(metrics["session_bytes"], 0)
+        self.assertEqual(metrics["resident_bytes"], metrics["shared_bytes"])
+        self.assertIs(manager.get(0), shared)
+
+    def test_lru_eviction_under_budget(self):
+        """Test that least recently used private payloads are evicted first"""
+        manager = SessionMemoryManager(budget_bytes=int(2.5 * self.frame_bytes))
+        manager.put("a", self.make_payload())
+        manager.put("b", self.make_payload())
+        manager.get("a")
+        manager.put("c", self.make_payload())
+        
+        self.assertIsNone(manager.get("b"))
+        self.assertIsNotNone(manager.get("a"))
+        self.assertIsNotNone(manager.get("c"))
+        metrics = manager.metrics()
+        self.assertEqual(metrics["evictions"], 1)
+        self.assertGreaterEqual(metrics["evicted_bytes"], self.frame_bytes)
+        self.assertLessEqual(metrics["resident_bytes"], manager.budget_bytes)
+        self.assertEqual(metrics["sessions"], 2)
+        self.assertGreaterEqual(manager.session_metrics("a")["datasets"]["raw_data"], self.frame_bytes)
+
+    def test_downgrade_to_shared_before_evicting(self):
+        """Test that private copies of the shared version are downgraded, not evicted"""
+        manager = SessionMemoryManager(budget_bytes=int(2.5 * self.frame_bytes))
+        manager.put("a", self.make_payload(), "v1")
+        manager.put("b", self.make_payload(), None)
+        shared = self.make_payload()
+        manager.share("v1", shared)
+        
+        self.assertIs(manager.get("a"), shared)
+        self.assertIsNotNone(manager.get("b"))
+        metrics = manager.metrics()
+        self.assertEqual(metrics["downgrades"], 1)
+        self.assertEqual(metrics["evictions"], 0)
+
+    def test_new_shared_version_reaccounts_old_references(self):
+        """Test that sessions left on an old shared payload are charged for it"""
+        manager = SessionMemoryManager(budget_bytes=10 * self.frame_bytes)
+        old = self.make_payload()
+        manager.share("v1", old)
+        manager.put("a", old, "v1")
+        manager.share("v2", self.make_payload())
+        
+        self.assertGreaterEqual(manager.session_metrics("a")["bytes"], self.frame_bytes)
+        self.assertIsNone(manager.shared("v1"))
+
+    def test_idle_sessions_expire(self):
+        """Test that sessions unused for idle_seconds are dropped, even shared references"""
+        now = [0.0]
+        manager = SessionMemoryManager(budget_bytes=10 * self.frame_bytes, idle_seconds=60, clock=lambda: now[0])
+        shared = self.make_payload()
+        manager.share("v1", shared)
+        manager.put("a", shared, "v1")
+        manager.put("b", shared, "v1")
+        now[0] = 50.0
+        manager.get("b")
+        now[0] = 100.0
+        
+        self.assertEqual(manager.metrics()["sessions"], 1)
+        self.assertIsNone(manager.get("a"))
+        self.assertIs(manager.get("b"), shared)
+        self.assertEqual(manager.metrics()["expired_sessions"], 1)
+
+    def test_session_cap(self):
+        """Test that the least recently used sessions are dropped beyond max_sessions"""
+        manager = SessionMemoryManager(budget_bytes=10 * self.frame_bytes, max_sessions=3)
+        shared = self.make_payload()
+        manager.share("v1", shared)
+        for session in range(5):
+            manager.put(session, shared, "v1")
+        
+        self.assertEqual(manager.metrics()["sessions"], 3)
+        self.assertIsNone(manager.get(0))
+        self.assertIsNone(manager.get(1))
+        self.assertIs(manager.get(4), shared)
+
+    def test_remove(self):
+        """Test that a removed session no longer holds its payload"""
+        manager = SessionMemoryManager(budget_bytes=10 * self.frame_bytes)
+        manager.put("a", self.make_payload())
+        manager.remove("a")
+        manager.remove("missing")
+        
+        self.assertIsNone(manager.get("a"))
+        self.assertEqual(manager.metrics()["session_bytes"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.data_processing.quality import (
+    clean_price_dataframe,
+    get_price_column,
+    PRICE_COLUMN_ATTR
+)
+from src.data_processing.correlation import (
+    get_price_series,
+    validate_price_dataframe,
+    calculate_fixed_window_correlation
+)
+
+class TestQuality(unittest.TestCase):
+    def setUp(self):
+        """Setup test data"""
+        dates = pd.date_range(start='2020-01-01', end='2020-12-31', freq='D')
+        rng = np.random.default_rng(42)
+        self.price_data = pd.DataFrame({
+            'close': 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates)))),
+            'volume': rng.integers(1000, 100000, len(dates))
+        }, index=dates)
+
+    def test_clean_data_is_untouched(self):
+        """Test that a clean series passes through with an empty report"""
+        cleaned, report = clean_price_dataframe(self.price_data, "GOLD")
+        
+        self.assertTrue(report.is_clean)
+        self.assertEqual(report.name, "GOLD")
+        self.assertEqual(report.rows_out, len(self.price_data))
+        self.assertTrue((cleaned['close'] == self.price_data['close']).all())
+        self.assertEqual(cleaned.attrs, {PRICE_COLUMN_ATTR: 'close'})
+
+    def test_duplicates_and_ordering(self):
+        """Test that duplicate timestamps are dropped and the index is sorted"""
+        dirty = pd.concat([self.price_data.iloc[10:20], self.price_data.iloc[:15]])
+        cleaned, report = clean_price_dataframe(dirty)
+        
+        self.assertTrue(report.non_monotonic)
+        self.assertEqual(report.duplicates, 5)
+        self.assertEqual(report.rows_out, 20)
+        self.assertTrue(cleaned.index.is_monotonic_increasing)
+        self.assertFalse(cleaned.index.has_duplicates)
+
+    def test_zeros_and_bad_prints_masked(self):
+        """Test that non-positive prices and isolated spikes become missing"""
+        dirty = self.price_data.copy()
+        dirty.iloc[50, 0] = 0
+        dirty.iloc[100, 0] = dirty.iloc[100, 0] * 10
+        cleaned, report = clean_price_dataframe(dirty)
+        
+        self.assertEqual(report.non_positive, 1)
+        self.assertEqual(report.outliers, 1)
+        self.assertEqual(report.missing, 2)
+        self.assertTrue(np.isnan(cleaned['close'].iloc[50]))
+        self.assertTrue(np.isnan(cleaned['close'].iloc[100]))
+
+    def test_level_shift_is_not_an_outlier(self):
+        """Test that a persistent jump is kept as a genuine move"""
+        dirty = self.price_data.copy()
+        dirty.iloc[100:, 0] = dirty.iloc[100:, 0] * 3
+        _, report = clean_price_dataframe(dirty)
+        
+        self.assertEqual(report.outliers, 0)
+
+    def test_gaps_detected(self):
+        """Test that missing stretches of bars are reported as gaps"""
+        dirty = self.price_data.drop(self.price_data.index[30:40])
+        _, report = clean_price_dataframe(dirty)
+        
+        self.assertEqual(len(report.gaps), 1)
+        self.assertEqual(report.gaps[0], (self.price_data.index[29], self.price_data.index[40]))
+
+    def test_invalid_input(self):
+        """Test that invalid frames are rejected at ingest"""
+        with self.assertRaises(TypeError):
+            clean_price_dataframe("not a dataframe")
+        with self.assertRaises(ValueError):
+            clean_price_dataframe(pd.DataFrame({'status': ['active'] * 3}))
+
+    def test_downstream_uses_price_column(self):
+        """Test that correlation helpers rely on the price column recorded at ingest"""
+        custom = self.price_data.rename(columns={'close': 'price'})[['volume', 'price']]
+        custom['volume'] = custom['volume'].astype('int32')
+        cleaned, _ = clean_price_dataframe(custom)
+        
+        # Resolved once at ingest: 'price' is the first float/int64 column
+        self.assertEqual(get_price_column(cleaned), 'price')
+        validate_price_dataframe(cleaned)
+        self.assertTrue((get_price_series(cleaned) == custom['price']).all())
+        corr = calculate_fixed_window_correlation(cleaned, clean_price_dataframe(self.price_data)[0], 30)
+        self.assertAlmostEqual(corr, 1.0)
+
+    def test_derived_frames_ignore_stale_price_column(self):
+        """Test that frames derived from a cleaned frame fall back to the column scan"""
+        cleaned, _ = clean_price_dataframe(self.price_data)
+        
+        selected = cleaned[['volume']]
+        self.assertIn(PRICE_COLUMN_ATTR, selected.attrs)
+        self.assertIsNone(get_price_column(selected))
+        self.assertTrue((get_price_series(selected) == cleaned['volume']).all())
+        
+        renamed = cleaned.rename(columns={'close': 'Close'})
+        self.assertIsNone(get_price_column(renamed))
+        self.assertTrue((get_price_series(renamed) == cleaned['close']).all())
+        
+        self.assertEqual(get_price_column(cleaned[['close']]), 'close')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+import os
+import sys
+import tempfile
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root and src to Python path; the benchmark is a top-level script like main.py
+project_root = str(Path(__file__).parent.parent)
+for path in (project_root, os.path.join(project_root, "src")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from datafeed.replay import (
+    RecordingClient, ReplayClient, ReplayMiss, InjectedFailure, fixture_path, load_fixture
+)
+from bench_pipeline import percentiles
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        """Setup a temporary fixture directory and recorded-looking frames"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.fixture_dir = self.temp_dir.name
+        dates = pd.date_range(start='2020-01-01', end='2020-12-31', freq='D')
+        rng = np.random.default_rng(5)
+        self.frames = {
+            "INDEX:BTCUSD": pd.DataFrame({'close': 100 + np.cumsum(rng.normal(0, 1, len(dates)))}, index=dates),
+            "INDEX:ETHUSD": pd.DataFrame({'close': 50 + np.cumsum(rng.normal(0, 1, len(dates)))}, index=dates),
+        }
+        live = Mock()
+        live.get_hist.side_effect = lambda symbol, interval, n_bars, **kwargs: self.frames[symbol].tail(n_bars)
+        self.recorder = RecordingClient(live, self.fixture_dir)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.temp_dir.cleanup()
+
+    def test_record_then_replay(self):
+        """Test that a recorded response is replayed unchanged"""
+        recorded = self.recorder.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=5000)
+        self.assertEqual(self.recorder.recorded, [fixture_path(self.fixture_dir, "INDEX:BTCUSD", "1D")])
+        self.assertEqual(load_fixture(self.recorder.recorded[0])["symbol"], "INDEX:BTCUSD")
+
+        replayed = ReplayClient(self.fixture_dir).get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=5000)
+        pd.testing.assert_frame_equal(replayed, recorded)
+
+    def test_replay_returns_last_bars(self):
+        """Test that replay serves only the requested number of most recent bars"""
+        self.recorder.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=5000)
+        replayed = ReplayClient(self.fixture_dir).get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=30)
+        pd.testing.assert_frame_equal(replayed, self.frames["INDEX:BTCUSD"].tail(30))
+
+    def test_failed_response_not_recorded(self):
+        """Test that a None response from the live feed leaves no fixture behind"""
+        live = Mock()
+        live.get_hist.return_value = None
+        recorder = RecordingClient(live, self.fixture_dir)
+        self.assertIsNone(recorder.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=10))
+        self.assertEqual(recorder.recorded, [])
+        with self.assertRaises(ReplayMiss):
+            ReplayClient(self.fixture_dir).get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=10)
+
+    def test_missing_fixture(self):
+        """Test that an unrecorded interval raises ReplayMiss"""
+        self.recorder.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=5000)
+        with self.assertRaises(ReplayMiss):
+            ReplayClient(self.fixture_dir).get_hist(symbol="INDEX:BTCUSD", interval="1W", n_bars=10)
+
+    def test_latency_and_jitter(self):
+        """Test that delays are the fixed latency plus non-negative seeded jitter"""
+        self.recorder.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=5000)
+        waits = []
+        client = ReplayClient(self.fixture_dir, latency=0.2, jitter=0.05, seed=3, sleep=waits.append)
+        for _ in range(50):
+            client.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=10)
+
+        self.assertEqual(client.requests, 50)
+        self.assertEqual(waits, client.delays)
+        self.assertTrue(all(delay >= 0.2 for delay in waits))
+        self.assertGreater(len(set(waits)), 1)
+
+        # Same seed, same delays
+        repeat = ReplayClient(self.fixture_dir, latency=0.2, jitter=0.05, seed=3, sleep=lambda seconds: None)
+        for _ in range(50):
+            repeat.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=10)
+        self.assertEqual(repeat.delays, waits)
+
+    def test_failure_injection(self):
+        """Test that failures are injected at the configured rate"""
+        self.recorder.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=5000)
+        client = ReplayClient(self.fixture_dir, failure_rate=1.0)
+        with self.assertRaises(InjectedFailure):
+            client.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=10)
+
+        client = ReplayClient(self.fixture_dir, failure_rate=0.3, seed=7)
+        for _ in range(200):
+            try:
+                client.get_hist(symbol="INDEX:BTCUSD", interval="1D", n_bars=10)
+            except ConnectionError:
+                pass
+        self.assertEqual(client.requests, 200)
+        self.assertTrue(30 < client.failures < 90)
+
+    def test_invalid_settings(self):
+        """Test that out-of-range settings are rejected"""
+        with self.assertRaises(ValueError):
+            ReplayClient(self.fixture_dir, latency=-1)
+        with self.assertRaises(ValueError):
+            ReplayClient(self.fixture_dir, failure_rate=1.5)
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles"""
+        values = list(range(1, 101))
+        self.assertEqual(percentiles(values), {"p50": 50, "p95": 95, "p99": 99})
+        self.assertEqual(percentiles([]), {"p50": None, "p95": None, "p99": None})
+
+    def test_benchmark_replays_pipeline(self):
+        """Test that the whole pipeline runs against recorded fixtures"""
+        from config.readConfig import MacroTicker
+        from bench_pipeline import run_benchmark
+        from pipeline import process_market_data
+
+        config = [MacroTicker(symbol="INDEX:ETHUSD", frequency="D")]
+        process_market_data(config, "digest", client=self.recorder)
+
+        client = ReplayClient(self.fixture_dir, latency=0.01, seed=1, sleep=lambda seconds: None)
+        report = run_benchmark(config, client, runs=3)
+        self.assertEqual(report["completed_runs"], 3)
+        self.assertEqual(report["requests"], 6)
+        self.assertEqual(set(report["mean_stage_seconds"]), {"fetch", "compute"})
+
+        failing = ReplayClient(self.fixture_dir, failure_rate=1.0)
+        report = run_benchmark(config, failing, runs=2)
+        self.assertEqual(report["failed_runs"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import os
+import tempfile
+import pandas as pd
+import numpy as np
+import sys
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.storage.snapshot import (
+    save_snapshot,
+    load_snapshot,
+    read_snapshot_info,
+    SnapshotRefresher,
+    STATE_VERSION
+)
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        """Setup test data and temporary directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "market_data.snap")
+        dates = pd.date_range(start='2020-01-01', periods=1000, freq='D')
+        self.state = {
+            "raw_data": {
+                "GOLD": pd.DataFrame({'close': np.random.normal(100, 10, len(dates)), 'symbol': 'GOLD'}, index=dates)
+            },
+            "correlation_data": {"GOLD": pd.Series({15: 0.5, 30: -0.25})},
+            "timeframes": [15, 30]
+        }
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test that a saved state loads back identically with its metadata"""
+        info = save_snapshot(self.path, self.state, "abc123")
+        snapshot = load_snapshot(self.path)
+        
+        self.assertEqual(snapshot.info.config_hash, "abc123")
+        self.assertEqual(snapshot.info.created_at, info.created_at)
+        pd.testing.assert_frame_equal(snapshot.state["raw_data"]["GOLD"], self.state["raw_data"]["GOLD"])
+        pd.testing.assert_series_equal(snapshot.state["correlation_data"]["GOLD"], self.state["correlation_data"]["GOLD"])
+        self.assertEqual(snapshot.state["timeframes"], [15, 30])
+        self.assertEqual(read_snapshot_info(self.path).config_hash, "abc123")
+
+    def test_loaded_arrays_are_writable_copy_on_write(self):
+        """Test that mapped arrays can be modified without changing the file"""
+        save_snapshot(self.path, self.state)
+        first = load_snapshot(self.path)
+        first.state["raw_data"]["GOLD"].iloc[0, 0] = -1.0
+        
+        second = load_snapshot(self.path)
+        self.assertEqual(second.state["raw_data"]["GOLD"].iloc[0, 0], self.state["raw_data"]["GOLD"].iloc[0, 0])
+
+    def test_overwrite_leaves_no_temporary_files(self):
+        """Test that saving replaces the snapshot atomically"""
+        save_snapshot(self.path, self.state)
+        save_snapshot(self.path, {"timeframes": [90]})
+        
+        self.assertEqual(os.listdir(self.temp_dir.name), ["market_data.snap"])
+        self.assertEqual(load_snapshot(self.path).state, {"timeframes": [90]})
+
+    def test_missing_or_foreign_file(self):
+        """Test that unusable files are treated as having no snapshot"""
+        self.assertIsNone(load_snapshot(self.path))
+        with open(self.path, 'wb') as f:
+            f.write(b"not a snapshot at all")
+        self.assertIsNone(load_snapshot(self.path))
+        self.assertIsNone(read_snapshot_info(self.path))
+
+    def test_corrupt_snapshot(self):
+        """Test that a truncated snapshot is treated as missing instead of raising"""
+        save_snapshot(self.path, self.state)
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(size // 2)
+        self.assertIsNone(load_snapshot(self.path))
+
+    def test_snapshot_from_other_release(self):
+        """Test that state written by an incompatible release is treated as missing"""
+        # Classes that no longer exist after a deploy
+        module = types.ModuleType("removed_state_module")
+        class Removed:
+            pass
+        Removed.__module__ = module.__name__
+        Removed.__qualname__ = "Removed"
+        module.Removed = Removed
+        with patch.dict(sys.modules, {module.__name__: module}):
+            save_snapshot(self.path, {"index": Removed()})
+        self.assertIsNone(load_snapshot(self.path))
+
+        # A bumped state version invalidates older snapshots before unpickling
+        save_snapshot(self.path, self.state)
+        with patch("src.storage.snapshot.STATE_VERSION", STATE_VERSION + 1):
+            self.assertIsNone(read_snapshot_info(self.path))
+            self.assertIsNone(load_snapshot(self.path))
+        self.assertIsNotNone(load_snapshot(self.path))
+
+    def test_refresher(self):
+        """Test that a background refresh persists and exposes the new state"""
+        refresher = SnapshotRefresher(self.path, lambda: (self.state, "def456"))
+        self.assertTrue(refresher.start())
+        refresher.join(timeout=10)
+        
+        self.assertIsNone(refresher.error)
+        self.assertEqual(refresher.latest.info.config_hash, "def456")
+        self.assertEqual(load_snapshot(self.path).info.config_hash, "def456")
+
+    def test_refresher_error(self):
+        """Test that a failed refresh keeps the previous snapshot"""
+        def fail():
+            raise ConnectionError("offline")
+        refresher = SnapshotRefresher(self.path, fail)
+        refresher.start()
+        refresher.join(timeout=10)
+        
+        self.assertIsInstance(refresher.error, ConnectionError)
+        self.assertIsNone(refresher.latest)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import os
+import sys
+import importlib.util
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.startup_profile import parse_importtime, profile_imports, total_import_seconds
+
+# Cold-import budget for the Streamlit entry point, in seconds. The default is about
+# ten times a typical cold import (~0.6s) so only a real regression trips it on a
+# noisy machine; set MACRO_IMPORT_BUDGET_S to tighten or relax it.
+IMPORT_BUDGET_SECONDS = float(os.environ.get("MACRO_IMPORT_BUDGET_S", "6"))
+
+class TestStartupProfile(unittest.TestCase):
+    def test_parse_importtime(self):
+        """Test parsing of -X importtime output"""
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   _io",
+            "import time:        80 |        200 | io",
+            "Traceback (most recent call last):",
+        ])
+        records = parse_importtime(output)
+        
+        self.assertEqual([r.module for r in records], ["_io", "io"])
+        self.assertEqual(records[0].depth, 1)
+        self.assertEqual(records[1].depth, 0)
+        self.assertEqual(records[1].self_us, 80)
+        self.assertAlmostEqual(total_import_seconds(records, "io"), 0.0002)
+        self.assertEqual(total_import_seconds(records, "missing"), 0.0)
+
+    @unittest.skipUnless(importlib.util.find_spec("streamlit"), "streamlit is not installed")
+    def test_entry_point_import_is_lazy(self):
+        """Test that importing the entry point does not load tvDatafeed"""
+        records = profile_imports("main", os.path.join(project_root, "src"))
+        modules = {record.module for record in records}
+        
+        self.assertNotIn("tvDatafeed", modules)
+
+    @unittest.skipUnless(importlib.util.find_spec("streamlit"), "streamlit is not installed")
+    def test_entry_point_cold_import_budget(self):
+        """Test that importing the entry point stays within budget"""
+        records = profile_imports("main", os.path.join(project_root, "src"))
+        self.assertLessEqual(total_import_seconds(records, "main"), IMPORT_BUDGET_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
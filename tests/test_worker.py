@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root and src to Python path; the worker is a top-level script like main.py
+project_root = str(Path(__file__).parent.parent)
+for path in (project_root, os.path.join(project_root, "src")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from worker import run_once
+from storage.result_store import ResultStore
+from storage.snapshot import load_snapshot
+from data_processing.quality import clean_price_dataframe
+
+class TestWorker(unittest.TestCase):
+    def setUp(self):
+        """Setup a temporary store, config and fake feed"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ResultStore(os.path.join(self.temp_dir.name, "market_data.snap"), keep=2)
+        self.config_path = os.path.join(self.temp_dir.name, "MacroTickers.yaml")
+        with open(self.config_path, 'w') as f:
+            f.write('tickers:\n  - ticker: "INDEX:ETHUSD"\n    frequency: "D"\n')
+        
+        dates = pd.date_range(start='2020-01-01', end='2020-12-31', freq='D')
+        rng = np.random.default_rng(11)
+        self.frames = {
+            "INDEX:BTCUSD": pd.DataFrame({'close': 100 + np.cumsum(rng.normal(0, 1, len(dates)))}, index=dates),
+            "INDEX:ETHUSD": pd.DataFrame({"close": 50 + np.cumsum(rng.normal(0, 1, len(dates) - 10))}, index=dates[:-10]),
+        }
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.temp_dir.cleanup()
+    
+    def fake_fetch(self, ticker, client=None):
+        return clean_price_dataframe(self.frames[ticker.symbol], ticker.symbol)
+
+    def test_run_once_publishes_current_version(self):
+        """Test that a run publishes a readable snapshot with its metrics"""
+        with patch("pipeline.fetch_ticker_data", side_effect=self.fake_fetch):
+            run = run_once(self.store, self.config_path)
+        
+        snapshot = load_snapshot(self.store.current_path)
+        self.assertEqual(list(snapshot.state["correlation_data"]), ["INDEX:ETHUSD"])
+        self.assertEqual(snapshot.state["quality"]["INDEX:ETHUSD"].name, "INDEX:ETHUSD")
+        self.assertEqual(snapshot.state["bitcoin_quality"].name, "INDEX:BTCUSD")
+        self.assertEqual(self.store.versions(), [run["version"]])
+        self.assertEqual(set(run["stages"]), {"read_config", "fetch", "compute", "publish"})
+        self.assertGreater(run["duration_seconds"], 0)
+        self.assertEqual(run["freshness"]["stalest_bar"], "2020-12-21T00:00:00")
+        
+        stored = self.store.current_run()
+        self.assertEqual(stored["version"], run["version"])
+        self.assertEqual(stored["freshness"], run["freshness"])
+
+    def test_failed_run_keeps_current_version(self):
+        """Test that a failing fetch leaves the published result untouched"""
+        with patch("pipeline.fetch_ticker_data", side_effect=self.fake_fetch):
+            run = run_once(self.store, self.config_path)
+        with patch("pipeline.fetch_ticker_data", side_effect=ConnectionError("offline")):
+            with self.assertRaises(ConnectionError):
+                run_once(self.store, self.config_path)
+        
+        self.assertEqual(self.store.current_run()["version"], run["version"])
+        self.assertIsNotNone(load_snapshot(self.store.current_path))
+
+    def test_old_versions_pruned(self):
+        """Test that only the configured number of versions is kept"""
+        with patch("pipeline.fetch_ticker_data", side_effect=self.fake_fetch):
+            versions = [run_once(self.store, self.config_path)["version"] for _ in range(3)]
+        
+        self.assertEqual(self.store.versions(), versions[1:])
+        self.assertEqual(load_snapshot(self.store.current_path).info.created_at.isoformat(),
+                         self.store.current_run()["created_at"])
+
+
+if __name__ == '__main__':
+    unittest.main()